@@ -6,13 +6,23 @@ AI早报前端应用 - 后端API服务
 """
 
 import os
-import re
+import sys
 import json
+import threading
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from flask import Flask, jsonify, request, render_template
 from flask_cors import CORS
-import markdown
+
+# 与静态站点生成器共用早报markdown的解析规则，需要能导入项目根目录下的utils包
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+from utils.modules.report_markdown import (
+    BV_RE, COUNT_RE, DATE_RE, FILENAME_RE_NEW, FILENAME_RE_OLD, H1_RE, HTML_METADATA_RE,
+    OVERVIEW_RE, TIME_RE, TITLE_RE, create_markdown, has_code_block, strip_header,
+)
 
 app = Flask(__name__)
 CORS(app)
@@ -21,6 +31,7 @@ CORS(app)
 DOCS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'docs')
 PAGE_SIZE = 10
 
+
 class NewspaperService:
     """早报数据服务"""
 
@@ -28,11 +39,19 @@ class NewspaperService:
         self.docs_dir = docs_dir
         self._cache = {}
         self._last_load_time = None
+        # 单个文件的解析结果，按 (mtime_ns, size) 判断文件是否变化，缓存过期重新加载时只解析变化的文件
+        self._parsed_files: Dict[str, Tuple[Tuple[int, int], Optional[Dict]]] = {}
+
+        # 复用Markdown渲染器，扩展只初始化一次；不含代码块的文档使用不加载codehilite/Pygments的轻量渲染器。
+        # Markdown实例不是线程安全的，Flask多线程处理请求时需要加锁
+        self._md = create_markdown(highlight=True)
+        self._md_plain = create_markdown(highlight=False)
+        self._md_lock = threading.Lock()
 
     def _parse_filename(self, filename: str) -> Dict:
         """解析文件名获取信息"""
         # 文件名格式: 日期_AI早报_BV号.md (新格式)
-        match = re.match(r'(\d{4}-\d{2}-\d{2})_AI早报_([^\.]+)\.md', filename)
+        match = FILENAME_RE_NEW.match(filename)
         if match:
             return {
                 'bv_id': match.group(2),
@@ -41,7 +60,7 @@ class NewspaperService:
             }
 
         # 兼容旧格式: BV号_日期_AI早报.md
-        match_old = re.match(r'([^_]+)_(\d{4}-\d{2}-\d{2})_AI早报\.md', filename)
+        match_old = FILENAME_RE_OLD.match(filename)
         if match_old:
             return {
                 'bv_id': match_old.group(1),
@@ -58,59 +77,43 @@ class NewspaperService:
                 content = f.read()
 
             # 提取标题
-            title_match = re.search(r'^# (.+)$', content, re.MULTILINE)
+            title_match = TITLE_RE.search(content)
             title = title_match.group(1) if title_match else '未知标题'
 
             # 提取发布日期
-            date_match = re.search(r'\*\*📅 发布日期：\*\* (\d{4}-\d{2}-\d{2})', content)
+            date_match = DATE_RE.search(content)
             publish_date = date_match.group(1) if date_match else None
 
             # 提取BV号
-            bv_match = re.search(r'\*\*🎬 BV号：\*\* ([^\n]+)', content)
+            bv_match = BV_RE.search(content)
             bv_id = bv_match.group(1) if bv_match else None
 
             # 提取整理时间
-            time_match = re.search(r'\*\*📝 整理时间：\*\* ([^\n]+)', content)
+            time_match = TIME_RE.search(content)
             organize_time = time_match.group(1) if time_match else None
 
             # 提取资讯数量
-            count_match = re.search(r'\*\*📊 资讯数量：\*\* (\d+)', content)
+            count_match = COUNT_RE.search(content)
             news_count = int(count_match.group(1)) if count_match else 0
 
             # 提取概览
-            overview_match = re.search(r'## 📋 本期概览\n\n(.+?)\n\n---', content, re.DOTALL)
+            overview_match = OVERVIEW_RE.search(content)
             overview = overview_match.group(1).strip() if overview_match else ''
 
-            # 转换为HTML并移除第一个h1标题以避免二次渲染
-            html_content = markdown.markdown(
-                content,
-                extensions=[
-                    'extra',
-                    'codehilite',
-                    'tables',
-                    'toc',
-                    'fenced_code',
-                    'nl2br',
-                    'attr_list',
-                    'def_list',
-                    'footnotes',
-                    'admonition'
-                ],
-                extension_configs={
-                    'codehilite': {
-                        'css_class': 'highlight',
-                        'use_pygments': True
-                    }
-                }
-            )
-
-            # 移除第一个h1标签以避免在详情页面二次渲染标题
-            html_content = re.sub(r'<h1[^>]*>.*?</h1>', '', html_content, count=1, flags=re.DOTALL)
-
-            # 移除原有的元数据信息（发布日期、BV号、整理时间、资讯数量）和后面的分隔符
-            # 匹配从<strong>📅 发布日期：</strong>开始到<strong>📊 资讯数量：</strong> ... 条</p>以及后面的<hr />，同时清理多余的换行
-            metadata_pattern = r'<p><strong>📅 发布日期：</strong>.*?<strong>📊 资讯数量：</strong>\s*\d+\s*条</p>\s*<hr\s*/?>'
-            html_content = re.sub(metadata_pattern, '', html_content, flags=re.DOTALL)
+            # 转换为HTML，标题和元数据在详情页面中单独渲染，优先在markdown层面去掉
+            body = strip_header(content)
+            markdown_text = content if body is None else body
+            md = self._md if has_code_block(markdown_text) else self._md_plain
+            with self._md_lock:
+                html_content = md.reset().convert(markdown_text)
+
+            if body is None:
+                # 头部不是标准格式时回退到HTML清理：移除第一个h1标签以避免在详情页面二次渲染标题
+                html_content = H1_RE.sub('', html_content, count=1)
+
+                # 移除原有的元数据信息（发布日期、BV号、整理时间、资讯数量）和后面的分隔符
+                # 匹配从<strong>📅 发布日期：</strong>开始到<strong>📊 资讯数量：</strong> ... 条</p>以及后面的<hr />，同时清理多余的换行
+                html_content = HTML_METADATA_RE.sub('', html_content)
 
             # 清理开头的多余空白字符
             html_content = html_content.lstrip()
@@ -145,19 +148,30 @@ class NewspaperService:
             return newspapers
 
         # 遍历docs目录下的所有markdown文件
-        for filename in os.listdir(self.docs_dir):
-            if filename.endswith('.md'):
-                file_info = self._parse_filename(filename)
-                if file_info:
-                    filepath = os.path.join(self.docs_dir, filename)
-                    newspaper_data = self._parse_markdown_file(filepath)
-
-                    if newspaper_data:
-                        # 合并文件信息和解析内容
-                        newspaper_data.update(file_info)
-                        # 只添加有咨询的文件，跳过0个咨询的文件
-                        if newspaper_data.get('news_count', 0) > 0:
-                            newspapers.append(newspaper_data)
+        parsed_files = {}
+        with os.scandir(self.docs_dir) as it:
+            for entry in it:
+                if entry.name.endswith('.md') and entry.is_file():
+                    file_info = self._parse_filename(entry.name)
+                    if file_info:
+                        stat = entry.stat()
+                        file_key = (stat.st_mtime_ns, stat.st_size)
+                        cached = self._parsed_files.get(entry.path)
+                        if cached and cached[0] == file_key:
+                            newspaper_data = cached[1]
+                        else:
+                            newspaper_data = self._parse_markdown_file(entry.path)
+                        parsed_files[entry.path] = (file_key, newspaper_data)
+
+                        if newspaper_data:
+                            # 合并文件信息和解析内容
+                            newspaper_data.update(file_info)
+                            # 只添加有咨询的文件，跳过0个咨询的文件
+                            if newspaper_data.get('news_count', 0) > 0:
+                                newspapers.append(newspaper_data)
+
+        # 只保留仍然存在的文件
+        self._parsed_files = parsed_files
 
         # 按日期排序（最新的在前面）
         newspapers.sort(key=lambda x: x.get('publish_date', ''), reverse=True)
@@ -19,6 +19,11 @@ from typing import Dict, List, Optional
 
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时回退到标准库 json
+    orjson = None
+
 from utils.modules.bilibili_api import BilibiliAPI
 from utils.modules.subtitle_processor_ai import AISubtitleProcessor
 from utils.modules.email_sender import EmailSender
@@ -76,12 +81,17 @@ class JuyaProcessor:
     def _load_processed_videos(self) -> Dict:
         """加载已处理的视频记录"""
         if PROCESSED_VIDEOS_PATH.exists():
+            if orjson is not None:
+                return orjson.loads(PROCESSED_VIDEOS_PATH.read_bytes())
             with open(PROCESSED_VIDEOS_PATH, 'r', encoding='utf-8') as f:
                 return json.load(f)
         return {}
     
     def _save_processed_videos(self, processed: Dict):
         """保存已处理的视频记录"""
+        if orjson is not None:
+            PROCESSED_VIDEOS_PATH.write_bytes(orjson.dumps(processed, option=orjson.OPT_INDENT_2))
+            return
         with open(PROCESSED_VIDEOS_PATH, 'w', encoding='utf-8') as f:
             json.dump(processed, f, ensure_ascii=False, indent=2)
     
@@ -766,6 +776,9 @@ def main():
     except Exception as e:
         logger.error(f"Runtime error: {e}")
         sys.exit(1)
+    finally:
+        # 释放视频兜底处理器的语音识别线程池
+        processor.fallback_processor.close()
 
 
 if __name__ == "__main__":
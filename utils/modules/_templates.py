@@ -0,0 +1,210 @@
+"""
+大段文本模板
+集中存放提示词和邮件HTML骨架，调用方通过 format_map 填充
+"""
+
+# 新闻分类对应的emoji
+CATEGORY_EMOJI = {
+    '产品发布': '🚀',
+    '技术更新': '🔧',
+    '行业动态': '📈',
+    '其他': '📰'
+}
+
+# 仅从UP主评论中提取新闻的提示词
+# 占位符: video_title, comments_text
+NEWS_FROM_COMMENTS_PROMPT = """你是一个专业的AI资讯编辑。请结合视频标题和UP主评论，提炼出结构化的新闻条目。
+
+视频标题：{video_title}
+
+UP主评论内容：
+{comments_text}
+
+重要说明：
+1. 视频标题通常指向本期最重要的新闻，需要注意识别对应的新闻内容
+2. UP主评论是唯一的信息来源，需要充分利用评论中的信息
+3. 特别注意评论中的时间戳信息（如"Intro: 00:00"、"Google 上线...: 00:10"等），这些往往是新闻条目的准确结构
+4. 评论中的时间戳格式内容是最有价值的新闻结构信息
+5. 可能需要根据有限的评论信息进行合理的内容扩展
+
+处理策略：
+1. 优先从评论中识别新闻条目结构（特别是时间戳格式）
+2. 识别视频标题指向的重点新闻内容
+3. 根据评论中的信息推断新闻的详细内容
+4. 如果评论信息有限，需要基于专业背景进行合理的内容补充
+5. 保持评论中已有的具体数据和事实
+
+要求：
+1. 识别并提取每一条独立的AI新闻
+2. 为每条新闻生成一个精炼的标题（10-25字，简洁明了）
+3. 写一段详细的新闻报道，尽可能详细地包含：
+   - 基于评论信息推断的核心事件描述
+   - 从评论中能提取或合理推断的功能、特性说明
+   - 可能的应用价值或行业影响
+   - 保留评论中的所有具体数据、版本号、时间点
+4. 提取相关的公司/产品/技术名称（2-3个主要实体）
+5. 保持专业客观的语气
+6. 重点关注视频标题所指向的新闻
+
+注意事项：
+- 如果评论信息较为简短，需要基于AI领域知识进行合理的内容扩展
+- 不要编造与评论信息明显矛盾的内容
+- 详细展开每个要点，提供充分的信息量
+- 保持内容的可读性和专业性
+
+输出JSON格式：
+{{
+  "news": [
+    {{
+      "title": "新闻标题",
+      "content": "详细新闻内容（150-300字）",
+      "entities": ["公司/产品名"],
+      "category": "产品发布|技术更新|行业动态|其他"
+    }}
+  ]
+}}
+
+只返回JSON，不要其他解释。"""
+
+# 邮件HTML骨架
+# 占位符: video_title, publish_date, bvid, total_news, overview_items, news_items, processed_time
+EMAIL_SHELL = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <style>
+        body {{
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
+            line-height: 1.6;
+            color: #333;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 20px;
+            background-color: #f5f5f5;
+        }}
+        .container {{
+            background-color: white;
+            border-radius: 8px;
+            padding: 30px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }}
+        h1 {{
+            color: #1a1a1a;
+            border-bottom: 3px solid #4CAF50;
+            padding-bottom: 10px;
+            font-size: 1.5em;
+        }}
+        .meta {{
+            color: #666;
+            font-size: 0.9em;
+            margin-bottom: 20px;
+        }}
+        .overview {{
+            background-color: #f8f9fa;
+            border-left: 4px solid #4CAF50;
+            padding: 15px;
+            margin: 20px 0;
+            border-radius: 4px;
+        }}
+        .overview-item {{
+            margin: 8px 0;
+            padding-left: 10px;
+        }}
+        .news-item {{
+            margin: 20px 0;
+            padding: 15px 0;
+            border-bottom: 1px solid #e8e8e8;
+        }}
+        .news-item:last-child {{
+            border-bottom: none;
+        }}
+        .news-item h3 {{
+            margin-top: 0;
+            margin-bottom: 10px;
+            color: #2c3e50;
+            font-size: 1.1em;
+        }}
+        .tags {{
+            margin: 10px 0;
+        }}
+        .tag {{
+            display: inline-block;
+            background-color: #e3f2fd;
+            color: #1976d2;
+            padding: 3px 10px;
+            border-radius: 12px;
+            font-size: 0.85em;
+            margin-right: 5px;
+        }}
+        .sources {{
+            margin-top: 10px;
+            font-size: 0.9em;
+        }}
+        .sources a {{
+            color: #1976d2;
+            text-decoration: none;
+        }}
+        .sources a:hover {{
+            text-decoration: underline;
+        }}
+        .footer {{
+            margin-top: 30px;
+            padding-top: 20px;
+            border-top: 1px solid #e0e0e0;
+            text-align: center;
+            color: #999;
+            font-size: 0.85em;
+        }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>📺 {video_title}</h1>
+
+        <div class="meta">
+            📅 发布日期：{publish_date} |
+            🎬 BV号：{bvid} |
+            📊 资讯数量：{total_news} 条
+        </div>
+
+        <div class="overview">
+            <strong>📋 本期概览</strong>
+            <div style="margin-top: 10px;">
+{overview_items}            </div>
+        </div>
+{news_items}
+        <div style="margin-top: 30px; padding: 20px; background-color: #f0f8ff; border-radius: 8px; text-align: center;">
+            <h3 style="margin-top: 0;">🎬 观看视频</h3>
+            <p style="margin: 10px 0;">
+                <a href="https://www.bilibili.com/video/{bvid}"
+                   style="display: inline-block; background-color: #00a1d6; color: white; padding: 10px 20px;
+                          border-radius: 5px; text-decoration: none; font-weight: bold;">
+                    在 Bilibili 观看完整视频
+                </a>
+            </p>
+            <p style="font-size: 0.9em; color: #666;">BV号：{bvid}</p>
+        </div>
+
+        <div class="footer">
+            整理自橘鸦AI早报 | {processed_time}
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+# 邮件概览中的单条目录
+# 占位符: index, emoji, title
+OVERVIEW_ITEM_TMPL = """                <div class="overview-item">{index}. {emoji} {title}</div>
+"""
+
+# 邮件正文中的单条新闻
+# 占位符: index, emoji, title, tags, content, sources
+NEWS_ITEM_TMPL = """
+        <div class="news-item">
+            <h3>{index}. {emoji} {title}</h3>
+{tags}
+            <p>{content}</p>
+{sources}        </div>
+"""
@@ -0,0 +1,99 @@
+"""
+早报markdown解析规则
+静态站点生成器(utils/web_generator.py)与Flask前端(frontend/app.py)共用，
+保证两者对同一篇早报的渲染结果一致
+"""
+
+import re
+from typing import Optional
+
+import markdown
+
+# 文件名格式: 日期_AI早报_BV号.md (新格式) / BV号_日期_AI早报.md (旧格式)
+FILENAME_RE_NEW = re.compile(r'(\d{4}-\d{2}-\d{2})_AI早报_([^\.]+)\.md')
+FILENAME_RE_OLD = re.compile(r'([^_]+)_(\d{4}-\d{2}-\d{2})_AI早报\.md')
+
+# markdown 元数据
+TITLE_RE = re.compile(r'^# (.+)$', re.MULTILINE)
+DATE_RE = re.compile(r'\*\*📅 发布日期：\*\* (\d{4}-\d{2}-\d{2})')
+BV_RE = re.compile(r'\*\*🎬 BV号：\*\* ([^\n]+)')
+TIME_RE = re.compile(r'\*\*📝 整理时间：\*\* ([^\n]+)')
+COUNT_RE = re.compile(r'\*\*📊 资讯数量：\*\* (\d+)')
+OVERVIEW_RE = re.compile(r'## 📋 本期概览\n\n(.+?)\n\n---', re.DOTALL)
+
+# 渲染后HTML中需要移除的第一个h1标题和元数据段落
+H1_RE = re.compile(r'<h1[^>]*>.*?</h1>', re.DOTALL)
+HTML_METADATA_RE = re.compile(r'<p><strong>📅 发布日期：</strong>.*?<strong>📊 资讯数量：</strong>\s*\d+\s*条</p>\s*<hr\s*/?>', re.DOTALL)
+
+# markdown渲染使用的扩展
+MARKDOWN_EXTENSIONS = [
+    'extra',
+    'codehilite',
+    'tables',
+    'toc',
+    'fenced_code',
+    'nl2br',
+    'attr_list',
+    'def_list',
+    'footnotes',
+    'admonition'
+]
+
+
+def create_markdown(highlight: bool = True) -> markdown.Markdown:
+    """创建早报使用的Markdown渲染器
+
+    Args:
+        highlight: 是否需要代码高亮；不含代码块的文档使用不加载codehilite/Pygments的轻量渲染器
+    """
+    if not highlight:
+        return markdown.Markdown(extensions=[ext for ext in MARKDOWN_EXTENSIONS if ext != 'codehilite'])
+    return markdown.Markdown(
+        extensions=MARKDOWN_EXTENSIONS,
+        extension_configs={
+            'codehilite': {
+                'css_class': 'highlight',
+                'use_pygments': True,
+                # 未标注语言的代码块不再猜测语言，避免对每个代码块运行全部词法分析器的猜测逻辑
+                'guess_lang': False
+            }
+        }
+    )
+
+
+def has_code_block(content: str) -> bool:
+    """判断文档是否可能包含代码块（围栏代码块或缩进代码块）"""
+    return '```' in content or '~~~' in content or '\n    ' in content or '\n\t' in content
+
+
+def strip_header(content: str) -> Optional[str]:
+    """在markdown层面去掉开头的h1标题和元数据段落及其后的分隔线
+
+    渲染后就不需要再用正则清理HTML；文档头部不是标准格式时返回None，由调用方回退到HTML清理
+
+    Args:
+        content: markdown文件内容
+
+    Returns:
+        去掉标题和元数据后的markdown内容，无法识别头部结构时返回None
+    """
+    if not content.startswith('# '):
+        return None
+
+    head, sep, rest = content.partition('\n\n---\n')
+    if not sep:
+        return None
+
+    # 元数据必须是分隔线之前的最后一个段落，以发布日期开头、资讯数量结尾
+    first_line_end = head.find('\n')
+    paragraph_start = head.rfind('\n\n') + 2
+    if first_line_end < 0 or paragraph_start <= first_line_end:
+        return None
+    paragraph = head[paragraph_start:]
+    last_line = paragraph.rpartition('\n')[2]
+    if not (paragraph.startswith('**📅 发布日期：**')
+            and last_line.startswith('**📊 资讯数量：** ') and last_line.endswith(' 条')
+            and last_line[len('**📊 资讯数量：** '):-2].isdigit()):
+        return None
+
+    return head[first_line_end:paragraph_start] + '\n' + rest
@@ -16,6 +16,7 @@ from dotenv import load_dotenv
 from ..logger import get_logger
 from .bilibili_api import BilibiliAPI
 from .content_formatter import ContentFormatter
+from ._templates import NEWS_FROM_COMMENTS_PROMPT
 
 load_dotenv()
 LLM_MODEL = os.getenv("OPENAI_MODEL")
@@ -229,9 +230,10 @@ class AISubtitleProcessor:
             result = self._extract_json_from_response(result_text)
 
             news_items = []
+            link_index = self._prepare_link_index(desc_links)
             for idx, news in enumerate(result.get('news', [])):
                 # 尝试从描述链接中匹配相关链接
-                source_links = self._match_links_for_news(news, desc_links)
+                source_links = self._match_links_for_news_prepared(news, link_index)
 
                 news_items.append({
                     'title': news.get('title', ''),
@@ -249,19 +251,35 @@ class AISubtitleProcessor:
             # 降级为简单提取
             return self._simple_extract_news(subtitles)
 
-    def _match_links_for_news(self, news: Dict, desc_links: List[Dict]) -> List[str]:
-        """尝试为新闻匹配相关链接"""
+    def _prepare_link_index(self, desc_links: List[Dict]) -> List[tuple]:
+        """
+        预处理描述链接，供多条新闻重复匹配时复用
+
+        Args:
+            desc_links: 从简介中提取的链接列表
+
+        Returns:
+            (小写标题, 标题词集合, 标题词列表, https链接) 元组列表
+        """
+        link_index = []
+        for link_item in desc_links:
+            desc_title = link_item['title'].lower()
+            desc_words = desc_title.split()
+            url = link_item['url'].replace('http://', 'https://')  # 避免出现http链接
+            link_index.append((desc_title, set(desc_words), desc_words, url))
+        return link_index
+
+    def _match_links_for_news_prepared(self, news: Dict, link_index: List[tuple]) -> List[str]:
+        """使用预处理后的链接索引为新闻匹配相关链接"""
         matched_links = []
 
         # 策略：基于标题相似度匹配
         news_title = news.get('title', '').lower()
         news_content = news.get('content', '').lower()
         news_entities = [e.lower() for e in news.get('entities', [])]
+        news_words = set(news_title.split())
 
-        for link_item in desc_links:
-            desc_title = link_item['title'].lower()
-            url = link_item['url']
-
+        for desc_title, desc_words, desc_word_list, url in link_index:
             # 计算相似度
             score = 0
 
@@ -271,17 +289,13 @@ class AISubtitleProcessor:
                     score += 3
 
             # 2. 标题关键词匹配
-            news_words = set(news_title.split())
-            desc_words = set(desc_title.split())
-            common_words = news_words & desc_words
-            score += len(common_words)
+            score += len(news_words & desc_words)
 
             # 3. 内容关键词匹配
-            if any(word in news_content for word in desc_title.split()):
+            if any(word in news_content for word in desc_word_list):
                 score += 1
 
             if score >= 2:  # 阈值
-                url = url.replace('http://','https://') # 避免出现http链接
                 matched_links.append(url)
 
         return matched_links[:3]  # 最多3个链接
@@ -416,9 +430,10 @@ class AISubtitleProcessor:
             result = self._extract_json_from_response(result_text)
 
             news_items = []
+            link_index = self._prepare_link_index(desc_links)
             for idx, news in enumerate(result.get('news', [])):
                 # 尝试从描述链接中匹配相关链接
-                source_links = self._match_links_for_news(news, desc_links)
+                source_links = self._match_links_for_news_prepared(news, link_index)
 
                 news_items.append({
                     'title': news.get('title', ''),
@@ -505,9 +520,10 @@ class AISubtitleProcessor:
             result = self._extract_json_from_response(result_text)
 
             news_items = []
+            link_index = self._prepare_link_index(desc_links)
             for idx, news in enumerate(result.get('news', [])):
                 # 尝试从描述链接中匹配相关链接
-                source_links = self._match_links_for_news(news, desc_links)
+                source_links = self._match_links_for_news_prepared(news, link_index)
 
                 news_items.append({
                     'title': news.get('title', ''),
@@ -604,9 +620,10 @@ class AISubtitleProcessor:
             result = self._extract_json_from_response(result_text)
 
             news_items = []
+            link_index = self._prepare_link_index(desc_links)
             for idx, news in enumerate(result.get('news', [])):
                 # 尝试从描述链接中匹配相关链接（虽然通常为空）
-                source_links = self._match_links_for_news(news, desc_links)
+                source_links = self._match_links_for_news_prepared(news, link_index)
 
                 news_items.append({
                     'title': news.get('title', ''),
@@ -869,8 +886,9 @@ class AISubtitleProcessor:
         if comments:
             comments_list = []
             for comment in comments:
-                if comment.get('content'):
-                    comments_list.append(comment.get('content', ''))
+                content = comment.get('content')
+                if content:
+                    comments_list.append(content)
             comments_text = ' '.join(comments_list)
 
         self.logger.info(f"Extracting news from speech and comments, speech length: {len(full_speech_text)}, comments length: {len(comments_text)}")
@@ -945,9 +963,10 @@ UP主评论内容：
             result = self._extract_json_from_response(result_text)
 
             news_items = []
+            link_index = self._prepare_link_index(desc_links)
             for idx, news in enumerate(result.get('news', [])):
                 # 尝试从描述链接中匹配相关链接
-                source_links = self._match_links_for_news(news, desc_links)
+                source_links = self._match_links_for_news_prepared(news, link_index)
 
                 news_items.append({
                     'title': news.get('title', ''),
@@ -991,64 +1010,17 @@ UP主评论内容：
         comments_text = ''
         comments_list = []
         for comment in comments:
-            if comment.get('content'):
-                comments_list.append(comment.get('content', ''))
+            content = comment.get('content')
+            if content:
+                comments_list.append(content)
         comments_text = ' '.join(comments_list)
 
         self.logger.info(f"Extracting news from comments only, total comments: {len(comments)}, text length: {len(comments_text)}")
 
-        prompt = f"""你是一个专业的AI资讯编辑。请结合视频标题和UP主评论，提炼出结构化的新闻条目。
-
-视频标题：{video_title}
-
-UP主评论内容：
-{comments_text}
-
-重要说明：
-1. 视频标题通常指向本期最重要的新闻，需要注意识别对应的新闻内容
-2. UP主评论是唯一的信息来源，需要充分利用评论中的信息
-3. 特别注意评论中的时间戳信息（如"Intro: 00:00"、"Google 上线...: 00:10"等），这些往往是新闻条目的准确结构
-4. 评论中的时间戳格式内容是最有价值的新闻结构信息
-5. 可能需要根据有限的评论信息进行合理的内容扩展
-
-处理策略：
-1. 优先从评论中识别新闻条目结构（特别是时间戳格式）
-2. 识别视频标题指向的重点新闻内容
-3. 根据评论中的信息推断新闻的详细内容
-4. 如果评论信息有限，需要基于专业背景进行合理的内容补充
-5. 保持评论中已有的具体数据和事实
-
-要求：
-1. 识别并提取每一条独立的AI新闻
-2. 为每条新闻生成一个精炼的标题（10-25字，简洁明了）
-3. 写一段详细的新闻报道，尽可能详细地包含：
-   - 基于评论信息推断的核心事件描述
-   - 从评论中能提取或合理推断的功能、特性说明
-   - 可能的应用价值或行业影响
-   - 保留评论中的所有具体数据、版本号、时间点
-4. 提取相关的公司/产品/技术名称（2-3个主要实体）
-5. 保持专业客观的语气
-6. 重点关注视频标题所指向的新闻
-
-注意事项：
-- 如果评论信息较为简短，需要基于AI领域知识进行合理的内容扩展
-- 不要编造与评论信息明显矛盾的内容
-- 详细展开每个要点，提供充分的信息量
-- 保持内容的可读性和专业性
-
-输出JSON格式：
-{{
-  "news": [
-    {{
-      "title": "新闻标题",
-      "content": "详细新闻内容（150-300字）",
-      "entities": ["公司/产品名"],
-      "category": "产品发布|技术更新|行业动态|其他"
-    }}
-  ]
-}}
-
-只返回JSON，不要其他解释。"""
+        prompt = NEWS_FROM_COMMENTS_PROMPT.format_map({
+            'video_title': video_title,
+            'comments_text': comments_text
+        })
 
         try:
             response = self.client.chat.completions.create(
@@ -1062,9 +1034,10 @@ UP主评论内容：
             result = self._extract_json_from_response(result_text)
 
             news_items = []
+            link_index = self._prepare_link_index(desc_links)
             for idx, news in enumerate(result.get('news', [])):
                 # 尝试从描述链接中匹配相关链接
-                source_links = self._match_links_for_news(news, desc_links)
+                source_links = self._match_links_for_news_prepared(news, link_index)
 
                 news_items.append({
                     'title': news.get('title', ''),
@@ -5,6 +5,8 @@ Juya Agent 工具函数
 
 import json
 import os
+import re
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Annotated
@@ -12,9 +14,15 @@ from pydantic import BaseModel, Field
 from dotenv import load_dotenv
 from agents import function_tool
 
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时回退到标准库 json
+    orjson = None
+
 from .modules.bilibili_api import BilibiliAPI, parse_cookie_string
 from .modules.subtitle_processor_ai import AISubtitleProcessor
 from .modules.email_sender import EmailSender
+from .modules._templates import CATEGORY_EMOJI, EMAIL_SHELL, NEWS_ITEM_TMPL, OVERVIEW_ITEM_TMPL
 from .logger import get_logger
 
 
@@ -34,6 +42,23 @@ DOCS_DIR.mkdir(exist_ok=True)
 # 使用统一的日志器
 logger = get_logger()
 
+# Markdown 解析用的正则（模块加载时编译一次）
+_OVERVIEW_RE = re.compile(
+    r'# (.+?)\n\n\*\*📅 发布日期：\*\* (.+?)\n\*\*🎬 BV号：\*\* (.+?)\n\*\*📝 整理时间：\*\* (.+?)\n\*\*📊 资讯数量：\*\* (\d+)'
+)
+_NEWS_HEAD_RE = re.compile(r'### (\d+)\. (🚀|🔧|📈|📰) (.+?) \{#[^}\n]*\}')
+_NEWS_TAG_RE = re.compile(r'`([^`]+)`')
+_NEWS_LINK_RE = re.compile(r'- <?(https?://[^\s>]+)')
+# 兼容 "**标签：**" 与 "**标签**：" 两种写法
+_NEWS_TAG_PREFIXES = ('**标签：**', '**标签**：')
+_NEWS_LINKS_MARK = '**🔗 相关链接：**'
+_EMOJI_CATEGORY = {
+    '🚀': '产品发布',
+    '🔧': '技术更新',
+    '📈': '行业动态',
+    '📰': '其他'
+}
+
 
 # ============= Pydantic Models =============
 
@@ -91,18 +116,72 @@ def _get_email_sender() -> EmailSender:
     return EmailSender()
 
 
+# 已处理视频记录的进程内缓存，按文件 (mtime, size) 判断是否失效
+_processed_videos_cache = {'key': None, 'data': {}}
+
+
+def _processed_videos_stat_key():
+    """获取已处理视频记录文件的缓存键，文件不存在时返回 None"""
+    try:
+        st = PROCESSED_VIDEOS_PATH.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
 def _load_processed_videos() -> dict:
     """加载已处理视频记录"""
-    if PROCESSED_VIDEOS_PATH.exists():
-        with open(PROCESSED_VIDEOS_PATH) as f:
-            return json.load(f)
-    return {}
+    key = _processed_videos_stat_key()
+    if key is None:
+        return {}
+    if key != _processed_videos_cache['key']:
+        if orjson is not None:
+            data = orjson.loads(PROCESSED_VIDEOS_PATH.read_bytes())
+        else:
+            with open(PROCESSED_VIDEOS_PATH, encoding='utf-8') as f:
+                data = json.load(f)
+        _processed_videos_cache['key'] = key
+        _processed_videos_cache['data'] = data
+    # 返回浅拷贝，避免调用方修改后污染缓存
+    return dict(_processed_videos_cache['data'])
 
 
 def _save_processed_videos(data: dict):
     """保存已处理视频记录"""
-    with open(PROCESSED_VIDEOS_PATH, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        PROCESSED_VIDEOS_PATH.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(PROCESSED_VIDEOS_PATH, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+    _processed_videos_cache['key'] = _processed_videos_stat_key()
+    _processed_videos_cache['data'] = dict(data)
+
+
+def _save_processed_data(md_path: Path, processed_data: dict):
+    """将 processed_data 保存为与 Markdown 同名的 JSON 文件"""
+    with open(md_path.with_suffix('.json'), 'w', encoding='utf-8') as f:
+        json.dump(processed_data, f, ensure_ascii=False)
+
+
+def _load_processed_data(md_path: str) -> dict:
+    """
+    加载 Markdown 文档对应的 processed_data
+
+    优先读取同名 JSON 文件，旧文档没有 JSON 文件时再回退到解析 Markdown
+
+    Args:
+        md_path: Markdown 文件路径
+
+    Returns:
+        processed_data 字典
+    """
+    json_path = Path(md_path).with_suffix('.json')
+    if json_path.exists():
+        with open(json_path, 'r', encoding='utf-8') as f:
+            processed_data = json.load(f)
+        if 'overview' in processed_data and 'news_items' in processed_data:
+            return processed_data
+    return _parse_markdown_to_data(md_path)
 
 
 def _parse_markdown_to_data(md_path: str) -> dict:
@@ -115,16 +194,11 @@ def _parse_markdown_to_data(md_path: str) -> dict:
     Returns:
         processed_data 字典
     """
-    import re
-
     with open(md_path, 'r', encoding='utf-8') as f:
         content = f.read()
 
     # 解析元信息
-    overview_match = re.search(
-        r'# (.+?)\n\n\*\*📅 发布日期：\*\* (.+?)\n\*\*🎬 BV号：\*\* (.+?)\n\*\*📝 整理时间：\*\* (.+?)\n\*\*📊 资讯数量：\*\* (\d+)',
-        content
-    )
+    overview_match = _OVERVIEW_RE.search(content)
 
     if not overview_match:
         raise ValueError("无法解析 Markdown 文件的元信息")
@@ -135,41 +209,36 @@ def _parse_markdown_to_data(md_path: str) -> dict:
     processed_time = overview_match.group(4)
     total_news = int(overview_match.group(5))
 
-    # 解析每条新闻
+    # 解析每条新闻：按分隔线切块，每块只用短小的锚定正则匹配标题行
     news_items = []
-    news_pattern = r'### (\d+)\. (🚀|🔧|📈|📰) (.+?) \{#.+?\}\n\n\*\*标签：\*\* (.+?)\n\n(.+?)(?:\n\n\*\*🔗 相关链接：\*\*\n(.+?))?\n\n---'
+    for block in content.split('\n---\n'):
+        block = block.strip()
+        head_match = _NEWS_HEAD_RE.match(block)
+        if not head_match:
+            continue
 
-    for match in re.finditer(news_pattern, content, re.DOTALL):
-        index = int(match.group(1))
-        emoji = match.group(2)
-        title = match.group(3)
-        tags_str = match.group(4)
-        news_content = match.group(5).strip()
-        links_str = match.group(6)
+        body = block[head_match.end():].strip()
 
         # 解析标签
-        entities = re.findall(r'`([^`]+)`', tags_str)
+        entities = []
+        if body.startswith(_NEWS_TAG_PREFIXES):
+            tags_str, _, body = body.partition('\n')
+            entities = _NEWS_TAG_RE.findall(tags_str)
+            body = body.strip()
 
         # 解析链接
         sources = []
-        if links_str:
-            sources = re.findall(r'- (https?://[^\s]+)', links_str)
-
-        # 判断分类
-        category_map = {
-            '🚀': '产品发布',
-            '🔧': '技术更新',
-            '📈': '行业动态',
-            '📰': '其他'
-        }
-        category = category_map.get(emoji, '其他')
+        links_pos = body.find(_NEWS_LINKS_MARK)
+        if links_pos != -1:
+            sources = _NEWS_LINK_RE.findall(body[links_pos + len(_NEWS_LINKS_MARK):])
+            body = body[:links_pos]
 
         news_items.append({
-            'index': index,
-            'title': title,
-            'content': news_content,
+            'index': int(head_match.group(1)),
+            'title': head_match.group(3),
+            'content': body.strip(),
             'entities': entities,
-            'category': category,
+            'category': _EMOJI_CATEGORY.get(head_match.group(2), '其他'),
             'sources': sources
         })
 
@@ -203,181 +272,49 @@ def _generate_email_html(processed_data: dict) -> str:
     overview = processed_data['overview']
     news_items = processed_data['news_items']
 
-    html = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        .container {{
-            background-color: white;
-            border-radius: 8px;
-            padding: 30px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        h1 {{
-            color: #1a1a1a;
-            border-bottom: 3px solid #4CAF50;
-            padding-bottom: 10px;
-            font-size: 1.5em;
-        }}
-        .meta {{
-            color: #666;
-            font-size: 0.9em;
-            margin-bottom: 20px;
-        }}
-        .overview {{
-            background-color: #f8f9fa;
-            border-left: 4px solid #4CAF50;
-            padding: 15px;
-            margin: 20px 0;
-            border-radius: 4px;
-        }}
-        .overview-item {{
-            margin: 8px 0;
-            padding-left: 10px;
-        }}
-        .news-item {{
-            margin: 20px 0;
-            padding: 15px 0;
-            border-bottom: 1px solid #e8e8e8;
-        }}
-        .news-item:last-child {{
-            border-bottom: none;
-        }}
-        .news-item h3 {{
-            margin-top: 0;
-            margin-bottom: 10px;
-            color: #2c3e50;
-            font-size: 1.1em;
-        }}
-        .tags {{
-            margin: 10px 0;
-        }}
-        .tag {{
-            display: inline-block;
-            background-color: #e3f2fd;
-            color: #1976d2;
-            padding: 3px 10px;
-            border-radius: 12px;
-            font-size: 0.85em;
-            margin-right: 5px;
-        }}
-        .sources {{
-            margin-top: 10px;
-            font-size: 0.9em;
-        }}
-        .sources a {{
-            color: #1976d2;
-            text-decoration: none;
-        }}
-        .sources a:hover {{
-            text-decoration: underline;
-        }}
-        .footer {{
-            margin-top: 30px;
-            padding-top: 20px;
-            border-top: 1px solid #e0e0e0;
-            text-align: center;
-            color: #999;
-            font-size: 0.85em;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>📺 {overview['video_title']}</h1>
-
-        <div class="meta">
-            📅 发布日期：{overview['publish_date']} |
-            🎬 BV号：{overview['bvid']} |
-            📊 资讯数量：{overview['total_news']} 条
-        </div>
-
-        <div class="overview">
-            <strong>📋 本期概览</strong>
-            <div style="margin-top: 10px;">
-"""
-
     # 概览中列出所有新闻标题（作为目录）
-    for item in news_items:
-        category_emoji = {
-            '产品发布': '🚀',
-            '技术更新': '🔧',
-            '行业动态': '📈',
-            '其他': '📰'
-        }.get(item['category'], '📰')
-        html += f"""                <div class="overview-item">{item['index']}. {category_emoji} {item['title']}</div>
-"""
-
-    html += """            </div>
-        </div>
-"""
-
+    overview_items = []
     # 详细内容部分
+    news_blocks = []
     for item in news_items:
-        category_emoji = {
-            '产品发布': '🚀',
-            '技术更新': '🔧',
-            '行业动态': '📈',
-            '其他': '📰'
-        }.get(item['category'], '📰')
-
-        html += f"""
-        <div class="news-item">
-            <h3>{item['index']}. {category_emoji} {item['title']}</h3>
-"""
-
+        category_emoji = CATEGORY_EMOJI.get(item['category'], '📰')
+        overview_items.append(OVERVIEW_ITEM_TMPL.format_map({
+            'index': item['index'],
+            'emoji': category_emoji,
+            'title': item['title']
+        }))
+
+        tags = ''
         if item['entities']:
-            html += '            <div class="tags">\n'
-            for entity in item['entities']:
-                html += f'                <span class="tag">{entity}</span>\n'
-            html += '            </div>\n'
-
-        html += f"""
-            <p>{item['content']}</p>
-"""
+            tags = ('            <div class="tags">\n'
+                    + ''.join(f'                <span class="tag">{entity}</span>\n' for entity in item['entities'])
+                    + '            </div>\n')
 
+        sources = ''
         if item['sources']:
-            html += '            <div class="sources">\n'
-            html += '                <strong>🔗 相关链接：</strong><br>\n'
-            for link in item['sources']:
-                html += f'                • <a href="{link}" target="_blank">{link}</a><br>\n'
-            html += '            </div>\n'
-
-        html += '        </div>\n'
-
-    html += f"""
-        <div style="margin-top: 30px; padding: 20px; background-color: #f0f8ff; border-radius: 8px; text-align: center;">
-            <h3 style="margin-top: 0;">🎬 观看视频</h3>
-            <p style="margin: 10px 0;">
-                <a href="https://www.bilibili.com/video/{overview['bvid']}"
-                   style="display: inline-block; background-color: #00a1d6; color: white; padding: 10px 20px;
-                          border-radius: 5px; text-decoration: none; font-weight: bold;">
-                    在 Bilibili 观看完整视频
-                </a>
-            </p>
-            <p style="font-size: 0.9em; color: #666;">BV号：{overview['bvid']}</p>
-        </div>
-
-        <div class="footer">
-            整理自橘鸦AI早报 | {overview['processed_time']}
-        </div>
-    </div>
-</body>
-</html>
-"""
+            sources = ('            <div class="sources">\n'
+                       '                <strong>🔗 相关链接：</strong><br>\n'
+                       + ''.join(f'                • <a href="{link}" target="_blank">{link}</a><br>\n' for link in item['sources'])
+                       + '            </div>\n')
+
+        news_blocks.append(NEWS_ITEM_TMPL.format_map({
+            'index': item['index'],
+            'emoji': category_emoji,
+            'title': item['title'],
+            'tags': tags,
+            'content': item['content'],
+            'sources': sources
+        }))
 
-    return html
+    return EMAIL_SHELL.format_map({
+        'video_title': overview['video_title'],
+        'publish_date': overview['publish_date'],
+        'bvid': overview['bvid'],
+        'total_news': overview['total_news'],
+        'processed_time': overview['processed_time'],
+        'overview_items': ''.join(overview_items),
+        'news_items': ''.join(news_blocks)
+    })
 
 
 # ============= Agent 工具函数 =============
@@ -397,14 +334,19 @@ def check_new_videos(count: Annotated[int, "检查最近的视频数量，默认
     videos = api.get_user_videos(uid=285286947, page_size=count)
     processed = _load_processed_videos()
 
-    new_videos = []
-    for v in videos:
-        if v['bvid'] not in processed:
-            new_videos.append(VideoInfo(
-                bvid=v['bvid'],
-                title=v['title'],
-                published=datetime.fromtimestamp(v['created']).strftime('%Y-%m-%d %H:%M:%S')
-            ))
+    # 先过滤掉已处理的视频，再为剩余视频格式化发布时间
+    # 字段均由本函数生成，使用 model_construct 跳过 pydantic 校验
+    processed_keys = processed.keys()
+    unprocessed = [v for v in videos if v['bvid'] not in processed_keys]
+
+    new_videos = [
+        VideoInfo.model_construct(
+            bvid=v['bvid'],
+            title=v['title'],
+            published=time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(v['created']))
+        )
+        for v in unprocessed
+    ]
 
     return VideoListResult(videos=new_videos, total=len(new_videos))
 
@@ -436,6 +378,9 @@ def process_video(
     filename = f"{bvid}_{date_str}_AI早报.md"
     filepath = DOCS_DIR / filename
 
+    # 只加载一次处理记录，两个分支共用
+    processed_videos = _load_processed_videos()
+
     # 检查文档文件是否已存在
     if not force_regenerate and filepath.exists():
         # 文档已存在，直接返回已有信息
@@ -443,14 +388,13 @@ def process_video(
 
         # 从已存在的文档中解析资讯数量
         try:
-            processed_data = _parse_markdown_to_data(str(filepath))
+            processed_data = _load_processed_data(str(filepath))
             news_count = processed_data['overview']['total_news']
         except Exception as e:
             logger.error(f"Failed to parse document: {e}")
             news_count = 0  # 解析失败时返回 0
 
         # 确保记录在 processed_videos.json 中
-        processed_videos = _load_processed_videos()
         if bvid not in processed_videos:
             processed_videos[bvid] = {
                 'title': video_info['title'],
@@ -459,7 +403,7 @@ def process_video(
             }
             _save_processed_videos(processed_videos)
 
-        return ProcessResult(
+        return ProcessResult.model_construct(
             bvid=bvid,
             title=video_info['title'],
             markdown_path=str(filepath),
@@ -486,8 +430,10 @@ def process_video(
     with open(filepath, 'w', encoding='utf-8') as f:
         f.write(markdown)
 
+    # 同时保存结构化数据，供发送邮件时直接读取
+    _save_processed_data(filepath, processed_data)
+
     # 更新已处理记录
-    processed_videos = _load_processed_videos()
     processed_videos[bvid] = {
         'title': video_info['title'],
         'processed_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
@@ -497,7 +443,7 @@ def process_video(
 
     logger.info(f"Document generated: {filepath}")
 
-    return ProcessResult(
+    return ProcessResult.model_construct(
         bvid=bvid,
         title=video_info['title'],
         markdown_path=str(filepath),
@@ -534,8 +480,8 @@ def send_email_report(
         if bvid in processed_videos:
             md_path = processed_videos[bvid].get('subtitle_path')
             if md_path and os.path.exists(md_path):
-                # 从 Markdown 文件解析数据
-                processed_data = _parse_markdown_to_data(md_path)
+                # 读取结构化数据（旧文档回退到解析 Markdown）
+                processed_data = _load_processed_data(md_path)
 
                 # 生成精美的 HTML 邮件
                 html_content = _generate_email_html(processed_data)
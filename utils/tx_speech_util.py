@@ -3,6 +3,7 @@
 import os
 import sys
 import json
+import mmap
 from typing import List
 
 # 添加腾讯云语音SDK路径
@@ -75,20 +76,41 @@ class TXSpeechRecognizer:
         if not mp3_file_path.lower().endswith('.mp3'):
             raise ValueError("目前仅支持MP3格式的音频文件")
 
+        # 以只读内存映射方式读取音频文件，避免整体复制为bytes
+        with open(mp3_file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise ValueError(f"音频文件为空: {mp3_file_path}")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as audio_data:
+                return self.recognize_audio(audio_data, "mp3")
+
+    def recognize_audio(self, audio_data, voice_format: str = "mp3") -> List[str]:
+        """
+        识别内存中的音频数据
+
+        Args:
+            audio_data: 音频数据（bytes 或其他 bytes-like 对象）
+            voice_format: 音频格式，默认为mp3
+
+        Returns:
+            List[str]: 识别结果文本列表，每个元素对应一个声道的识别结果
+
+        Raises:
+            ValueError: 音频数据为空
+            Exception: 识别过程中的其他错误
+        """
+        if not len(audio_data):
+            raise ValueError("音频数据为空")
+
         try:
             # 创建识别请求
             req = flash_recognizer.FlashRecognitionRequest(self.engine_type)
             req.set_filter_modal(0)        # 不过滤语气词
             req.set_filter_punc(0)         # 不过滤标点符号
             req.set_filter_dirty(0)        # 不过滤脏话
-            req.set_voice_format("mp3")    # 设置音频格式为mp3
+            req.set_voice_format(voice_format)  # 设置音频格式
             req.set_word_info(0)           # 不返回词级别信息
             req.set_convert_num_mode(1)    # 数字转换模式
 
-            # 读取音频文件
-            with open(mp3_file_path, 'rb') as f:
-                audio_data = f.read()
-
             # 执行识别
             result_data = self.recognizer.recognize(req, audio_data)
             resp = json.loads(result_data)
@@ -106,9 +128,9 @@ class TXSpeechRecognizer:
             flash_result = resp.get("flash_result", [])
 
             for channel_result in flash_result:
-                text = channel_result.get("text", "")
-                if text.strip():  # 只添加非空文本
-                    text_results.append(text.strip())
+                text = channel_result.get("text", "").strip()
+                if text:  # 只添加非空文本
+                    text_results.append(text)
 
             return text_results
 
@@ -118,6 +140,23 @@ class TXSpeechRecognizer:
             raise Exception(f"语音识别过程中发生错误: {e}")
 
 
+def _create_recognizer(appid: str = None, secret_id: str = None, secret_key: str = None) -> TXSpeechRecognizer:
+    """从参数或环境变量获取凭证并创建识别器"""
+    # 首先检查SDK是否可用
+    if not SDK_AVAILABLE:
+        raise RuntimeError("腾讯云语音SDK不可用，请检查SDK是否正确安装")
+
+    # 从参数或环境变量获取凭证
+    appid = appid or os.getenv('TX_APPID')
+    secret_id = secret_id or os.getenv('TX_SECRET_ID')
+    secret_key = secret_key or os.getenv('TX_SECRET_KEY')
+
+    if not all([appid, secret_id, secret_key]):
+        raise ValueError("请提供APPID、SECRET_ID和SECRET_KEY参数，或设置相应的环境变量")
+
+    return TXSpeechRecognizer(appid, secret_id, secret_key)
+
+
 def recognize_speech_from_mp3(mp3_file_path: str, appid: str = None,
                             secret_id: str = None, secret_key: str = None) -> List[str]:
     """
@@ -136,21 +175,32 @@ def recognize_speech_from_mp3(mp3_file_path: str, appid: str = None,
         ValueError: 参数错误或凭证未提供
         RuntimeError: SDK不可用
     """
-    # 首先检查SDK是否可用
-    if not SDK_AVAILABLE:
-        raise RuntimeError("腾讯云语音SDK不可用，请检查SDK是否正确安装")
+    # 创建识别器并执行识别
+    recognizer = _create_recognizer(appid, secret_id, secret_key)
+    return recognizer.recognize_mp3(mp3_file_path)
 
-    # 从参数或环境变量获取凭证
-    appid = appid or os.getenv('TX_APPID')
-    secret_id = secret_id or os.getenv('TX_SECRET_ID')
-    secret_key = secret_key or os.getenv('TX_SECRET_KEY')
 
-    if not all([appid, secret_id, secret_key]):
-        raise ValueError("请提供APPID、SECRET_ID和SECRET_KEY参数，或设置相应的环境变量")
+def recognize_speech_from_bytes(audio_data, voice_format: str = "mp3", appid: str = None,
+                                secret_id: str = None, secret_key: str = None) -> List[str]:
+    """
+    便捷函数：从内存中的音频数据识别语音内容
 
-    # 创建识别器并执行识别
-    recognizer = TXSpeechRecognizer(appid, secret_id, secret_key)
-    return recognizer.recognize_mp3(mp3_file_path)
+    Args:
+        audio_data: 音频数据（bytes 或其他 bytes-like 对象）
+        voice_format: 音频格式，默认为mp3
+        appid: 腾讯云APPID（可选，也可通过环境变量TX_APPID设置）
+        secret_id: 腾讯云SECRET_ID（可选，也可通过环境变量TX_SECRET_ID设置）
+        secret_key: 腾讯云SECRET_KEY（可选，也可通过环境变量TX_SECRET_KEY设置）
+
+    Returns:
+        List[str]: 识别结果文本列表
+
+    Raises:
+        ValueError: 参数错误或凭证未提供
+        RuntimeError: SDK不可用
+    """
+    recognizer = _create_recognizer(appid, secret_id, secret_key)
+    return recognizer.recognize_audio(audio_data, voice_format)
 
 
 # 示例用法
@@ -4,15 +4,49 @@
 当视频简介为空时，通过下载视频、转音频、语音转文字的方式获取内容
 """
 
+import asyncio
+import logging
 import os
+import re
+import shlex
 import subprocess
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import Iterator, List, Optional, Dict, Tuple, Union
 
 from .logger import get_logger
-from .tx_speech_util import recognize_speech_from_mp3
+from .tx_speech_util import recognize_speech_from_bytes, recognize_speech_from_mp3
+
+# 转码输出的PCM音频每秒字节数（16kHz、16bit、单声道），用于按时长切分音频
+PCM_BYTES_PER_SECOND = 16000 * 2
+# 每段提交识别的音频时长（秒），分段越短首段结果返回越早
+SEGMENT_SECONDS = int(os.getenv('TX_SEGMENT_SECONDS', '30'))
+# 视频过长时均匀采样的时段数
+SAMPLE_WINDOWS = 3
+# you-get下载超时时间（秒）
+DOWNLOAD_TIMEOUT = 600
+# ffmpeg总超时时间与无进度判定为卡死的时间（秒）
+FFMPEG_TIMEOUT = 600
+FFMPEG_STALL_TIMEOUT = 30
+# ffmpeg -progress 输出的 key=value 进度行
+_FFMPEG_PROGRESS_RE = re.compile(r'^\w+=\S*$')
+
+
+class _CommandLine:
+    """延迟拼接命令行，只有日志真正输出时才执行 shlex.join"""
+
+    __slots__ = ('cmd',)
+
+    def __init__(self, cmd):
+        self.cmd = cmd
+
+    def __str__(self) -> str:
+        return shlex.join(self.cmd)
 
 
 class VideoFallbackProcessor:
@@ -37,10 +71,53 @@ class VideoFallbackProcessor:
 
         # 确保目录存在
         self.video_dir.mkdir(parents=True, exist_ok=True)
-
+        # 已创建过的日期目录名，避免每个视频都调用mkdir
+        self._dirs_ready: set[str] = set()
+
+        # 并发控制：ffmpeg进程数不超过CPU核数，语音识别请求数受TX_CONCURRENCY限制
+        self._ffmpeg_sema = threading.BoundedSemaphore(os.cpu_count() or 1)
+        self._api_concurrency = int(os.getenv('TX_CONCURRENCY', '8'))
+        self._api_sema = threading.BoundedSemaphore(self._api_concurrency)
+        # 语音识别线程池在首次使用时创建并在实例内常驻，批量处理多个视频时复用同一批线程；
+        # 线程数与识别请求并发上限一致，转码产出的分段可以立即提交。用完后需调用close()释放
+        self._recognize_pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+        # b站cookie文件只在初始化时检查一次
+        cookie_file = project_root / "config" / "cookies.txt"
+        self._cookie_args = ('--cookie', str(cookie_file)) if cookie_file.exists() else ()
+
+        # 识别的音频总时长上限（秒），0表示不限制、识别完整音轨
+        self.max_audio_seconds = int(os.getenv('FALLBACK_MAX_AUDIO_SECONDS', '0'))
+
+        # 已下载视频的缓存有效期（天），超过有效期的视频会重新下载
+        self.cache_ttl_days = int(os.getenv('FALLBACK_CACHE_DAYS', '7'))
+
+    def __enter__(self) -> 'VideoFallbackProcessor':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """释放语音识别线程池，之后再次识别时会重新创建"""
+        with self._pool_lock:
+            pool, self._recognize_pool = self._recognize_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _get_recognize_pool(self) -> ThreadPoolExecutor:
+        """获取语音识别线程池，不存在时创建"""
+        with self._pool_lock:
+            if self._recognize_pool is None:
+                self._recognize_pool = ThreadPoolExecutor(max_workers=self._api_concurrency,
+                                                          thread_name_prefix='speech-recognize')
+            return self._recognize_pool
+
+    @cached_property
     def _is_tx_speech_configured(self) -> bool:
         """
-        检查腾讯云语音SDK是否已配置
+        检查腾讯云语音SDK是否已配置，结果在实例内缓存（运行期间环境变量不会变化）
 
         Returns:
             bool: 是否已配置
@@ -52,14 +129,10 @@ class VideoFallbackProcessor:
 
         configured = all([appid, secret_id, secret_key])
 
-        if not configured:
-            missing_vars = []
-            if not appid:
-                missing_vars.append('TX_APPID')
-            if not secret_id:
-                missing_vars.append('TX_SECRET_ID')
-            if not secret_key:
-                missing_vars.append('TX_SECRET_KEY')
+        if not configured and self.logger.isEnabledFor(logging.DEBUG):
+            missing_vars = [name for name, value in (('TX_APPID', appid),
+                                                     ('TX_SECRET_ID', secret_id),
+                                                     ('TX_SECRET_KEY', secret_key)) if not value]
             self.logger.debug(f"缺少环境变量: {', '.join(missing_vars)}")
 
         return configured
@@ -92,7 +165,7 @@ class VideoFallbackProcessor:
         if len(desc) < 30:
             self.logger.info(f"Video description length: {len(desc)} characters, below 30 character threshold")
 
-            if not self._is_tx_speech_configured():
+            if not self._is_tx_speech_configured:
                 self.logger.warning("Tencent Cloud Speech SDK not configured, skipping file generation")
                 self.logger.info("   Please set environment variables: TX_APPID, TX_SECRET_ID, TX_SECRET_KEY")
                 return True
@@ -116,7 +189,7 @@ class VideoFallbackProcessor:
             return False
 
         # 没有字幕时，只要腾讯云SDK可用就需要生成语音转写
-        if not self._is_tx_speech_configured():
+        if not self._is_tx_speech_configured:
             self.logger.warning("Tencent Cloud Speech SDK not configured, skipping fallback logic")
             self.logger.info("   Please set environment variables: TX_APPID, TX_SECRET_ID, TX_SECRET_KEY")
             return False
@@ -136,168 +209,421 @@ class VideoFallbackProcessor:
             str|None: 下载的视频文件路径，失败时返回None
         """
         target_dir = self.video_dir / date_dir
-        target_dir.mkdir(exist_ok=True)
+        # 同一日期目录只需创建一次
+        if date_dir not in self._dirs_ready:
+            target_dir.mkdir(exist_ok=True)
+            self._dirs_ready.add(date_dir)
 
         # 构建B站视频URL
         video_url = f"https://www.bilibili.com/video/{bvid}/"
 
-        self.logger.info(f"Starting video download: {bvid}")
-        self.logger.info(f"Target directory: {target_dir}")
+        # 已有同一BV号的视频且未过期时直接复用，避免重复下载
+        cached_file = self._find_cached_video(target_dir, bvid)
+        if cached_file:
+            self.logger.info("Video cache hit: %s", cached_file)
+            return str(cached_file)
+
+        self.logger.info("Starting video download: %s", bvid)
+        self.logger.info("Target directory: %s", target_dir)
 
         try:
             # 构建you-get命令
-            cmd = [
+            cmd = (
                 'you-get',
                 '-o', str(target_dir),  # 输出目录
+                '-O', bvid,             # 以BV号命名输出文件，便于缓存查找
                 video_url,
-            ]
-            # 如果有b站cookie文件，加载
-            if os.path.exists('config/cookies.txt'):
-                cmd.extend(['--cookie', 'config/cookies.txt'])
-
-            self.logger.info(f"Executing command: {' '.join(cmd)}")
-
-            # 执行下载命令，设置超时为600秒
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=600,
-                encoding='utf-8'
+                *self._cookie_args,     # 如果有b站cookie文件，加载
             )
 
-            if result.returncode != 0:
-                self.logger.error("Video download failed:")
-                self.logger.error(f"Error output: {result.stderr}")
+            self.logger.info("Executing command: %s", _CommandLine(cmd))
+
+            # 执行下载命令，设置超时为600秒；输出保持为字节，只在需要记录时解码
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+            timed_out = threading.Event()
+
+            def _on_timeout():
+                timed_out.set()
+                proc.kill()
+
+            watchdog = threading.Timer(DOWNLOAD_TIMEOUT, _on_timeout)
+            watchdog.start()
+            # 只保留最后若干行输出，用于失败时输出错误信息；
+            # you-get的进度条以\r刷新，单行可能很长，每行只保留末尾部分
+            tail_lines = deque(maxlen=20)
+            output_size = 0
+            log_progress = self.logger.isEnabledFor(logging.DEBUG)
+            try:
+                for line in proc.stdout:
+                    output_size += len(line)
+                    line = line.rstrip()
+                    if line:
+                        tail_lines.append(line[-4096:])
+                        if log_progress:
+                            self.logger.debug(line.decode('utf-8', errors='replace'))
+                proc.wait()
+            finally:
+                watchdog.cancel()
+                if proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
+                proc.stdout.close()
+
+            if timed_out.is_set():
+                self.logger.error(f"Video download timeout ({DOWNLOAD_TIMEOUT} seconds)")
                 return None
 
-            self.logger.info("Video download command completed")
-            self.logger.info(f"Standard output: {result.stdout}")
-
-            # 查找下载的视频文件，重点查找 [01].mp4 结尾的文件
-            video_files = list(target_dir.glob("*[01].mp4"))
+            if proc.returncode != 0:
+                error_output = b'\n'.join(tail_lines).decode('utf-8', errors='replace')
+                self.logger.error("Video download failed:")
+                self.logger.error(f"Error output: {error_output}")
+                return None
 
-            if not video_files:
-                # 如果没找到[01].mp4，查找任意mp4文件
-                video_files = list(target_dir.glob("*.mp4"))
+            self.logger.info("Video download command completed, output %d bytes", output_size)
 
+            # 查找下载的视频文件：一次目录扫描同时取得文件名与大小；
+            # 日期目录被多个视频共用，只接受以BV号命名的文件，避免误用其他视频
+            video_files = self._scan_video_files(target_dir, bvid)
             if not video_files:
-                self.logger.error("No downloaded video file found")
+                self.logger.error("No downloaded video file found for %s", bvid)
                 return None
 
-            # 选择第一个找到的视频文件
-            video_file = video_files[0]
+            video_file, file_stat = video_files[0]
 
             # 检查文件大小（大于10KB）
-            file_size = video_file.stat().st_size
+            file_size = file_stat.st_size
             if file_size <= 10 * 1024:  # 10KB
                 self.logger.error(f"Video file too small: {file_size} bytes, possibly empty")
                 return None
 
-            self.logger.info(f"Found video file: {video_file}")
-            self.logger.info(f"File size: {file_size / 1024 / 1024:.2f} MB")
+            self.logger.info("Found video file: %s", video_file)
+            self.logger.info("File size: %.2f MB", file_size / 1024 / 1024)
 
             return str(video_file)
 
-        except subprocess.TimeoutExpired:
-            self.logger.error("Video download timeout (600 seconds)")
-            return None
         except Exception as e:
             self.logger.error(f"Error during video download: {e}")
             return None
 
-    def convert_to_mp3(self, video_path: str) -> Optional[str]:
+    def _scan_video_files(self, target_dir: Path, bvid: str) -> List[Tuple[Path, os.stat_result]]:
         """
-        将视频文件转换为MP3音频
+        单次扫描目录，返回以BV号命名的mp4文件及其stat信息
 
         Args:
-            video_path: 视频文件路径
+            target_dir: 视频所在的日期目录
+            bvid: BV号
 
         Returns:
-            str|None: 转换后的MP3文件路径，失败时返回None
+            List[Tuple[Path, os.stat_result]]: 按文件名排序的(文件路径, stat信息)列表
+        """
+        candidates = []
+        with os.scandir(target_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.startswith(bvid) or not name.endswith('.mp4') or not entry.is_file():
+                    continue
+                candidates.append((name, Path(entry.path), entry.stat()))
+
+        candidates.sort(key=lambda item: item[0])
+        return [(path, stat) for _, path, stat in candidates]
+
+    def _find_cached_video(self, target_dir: Path, bvid: str) -> Optional[Path]:
         """
-        video_file = Path(video_path)
-        mp3_file = video_file.parent / "output.mp3"
+        查找已下载且仍在缓存有效期内的视频文件
 
-        self.logger.info("Starting video to audio conversion:")
-        self.logger.info(f"Input file: {video_path}")
-        self.logger.info(f"Output file: {mp3_file}")
+        过期或过小的同名文件会被删除：you-get在目标文件已存在时会直接跳过下载，
+        不删除的话缓存有效期不会生效。
+
+        Args:
+            target_dir: 视频所在的日期目录
+            bvid: BV号
+
+        Returns:
+            Path|None: 可复用的视频文件路径，没有时返回None
+        """
+        expire_before = time.time() - self.cache_ttl_days * 86400
+        for video_file, stat in self._scan_video_files(target_dir, bvid):
+            if stat.st_size > 10 * 1024 and stat.st_mtime > expire_before:
+                return video_file
+            try:
+                video_file.unlink()
+                self.logger.info("Removed expired cached video: %s", video_file)
+            except OSError as e:
+                self.logger.warning(f"Failed to remove expired cached video {video_file}: {e}")
+        return None
+
+    def stream_audio_segments(self, video_path: str, segment_seconds: int = SEGMENT_SECONDS,
+                              start: Optional[float] = None, duration: Optional[float] = None) -> Iterator[bytes]:
+        """
+        通过ffmpeg管道将视频音轨解码为16kHz单声道PCM，并按固定时长分段产出，不落盘
+
+        识别服务直接接受PCM，省去MP3编码以及服务端的解码。
 
+        ffmpeg仍在转码时即可拿到已完成的分段，便于与语音识别重叠执行。
+        过短的末尾分段会并入上一段，避免提交几乎为空的音频。
+
+        Args:
+            video_path: 视频文件路径
+            segment_seconds: 每段音频时长（秒）
+            start: 截取的起始时间（秒），为None时从头开始
+            duration: 截取的时长（秒），为None时直到结尾
+
+        Yields:
+            bytes: 一段PCM音频数据（s16le）
+
+        Raises:
+            RuntimeError: ffmpeg执行失败、超时或输出音频过小
+        """
+        self.logger.info("Starting video to audio conversion:")
+        self.logger.info("Input file: %s", video_path)
+
+        # 只截取部分时段时，-ss放在-i之前以快速定位
+        seek_args = ['-ss', f'{start:.3f}'] if start is not None else []
+        duration_args = ['-t', f'{duration:.3f}'] if duration is not None else []
+
+        # 构建ffmpeg命令，PCM数据直接输出到标准输出
+        cmd = [
+            'ffmpeg',
+            '-v', 'error',              # 只输出错误信息
+            *seek_args,                 # 截取起始时间
+            '-i', video_path,           # 输入文件
+            *duration_args,             # 截取时长
+            '-vn',                      # 不处理视频流
+            '-ac', '1',                 # 单声道
+            '-ar', '16000',             # 采样率与16k识别引擎一致
+            '-threads', '4',            # 限制单个进程的线程数，便于多个视频并行转码
+            '-codec:a', 'pcm_s16le',    # 16bit小端PCM，无需压缩编码
+            '-f', 's16le',              # 输出裸PCM数据
+            '-progress', 'pipe:2',      # 进度信息输出到标准错误，用于检测卡死
+            '-nostats',                 # 关闭默认的统计输出
+            'pipe:1'                    # 输出到标准输出
+        ]
+        segment_bytes = PCM_BYTES_PER_SECOND * segment_seconds
+
+        self.logger.info("Executing command: %s", _CommandLine(cmd))
+
+        with self._ffmpeg_sema:
+            yield from self._run_ffmpeg_segments(cmd, segment_bytes)
+
+    def _run_ffmpeg_segments(self, cmd: List[str], segment_bytes: int) -> Iterator[bytes]:
+        """执行ffmpeg命令并按固定字节数分段读取其标准输出，同时监控进度"""
         try:
-            # 构建ffmpeg命令
-            cmd = [
-                'ffmpeg',
-                '-i', video_path,           # 输入文件
-                '-codec:a', 'libmp3lame',   # 音频编码器
-                '-b:a', '128k',             # 比特率
-                '-y',                       # 覆盖输出文件
-                str(mp3_file)               # 输出文件
-            ]
-
-            self.logger.info(f"Executing command: {' '.join(cmd)}")
-
-            # 执行转换命令，设置超时为600秒
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=600,
-                encoding='utf-8'
-            )
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        except OSError as e:
+            # ffmpeg不存在或无法启动时与其他转码失败一样处理，由调用方回退
+            raise RuntimeError(f"Failed to start ffmpeg: {e}") from e
+
+        # 后台读取标准错误：进度行用于刷新心跳，其余行作为错误输出保留
+        last_progress = [time.monotonic()]
+        error_lines = []
+
+        def _read_stderr():
+            for raw_line in proc.stderr:
+                line = raw_line.decode('utf-8', errors='replace').strip()
+                if _FFMPEG_PROGRESS_RE.match(line):
+                    last_progress[0] = time.monotonic()
+                elif line:
+                    error_lines.append(line)
+
+        stderr_reader = threading.Thread(target=_read_stderr, daemon=True)
+        stderr_reader.start()
+
+        # 监控线程：总耗时超过600秒或30秒无进度时终止ffmpeg
+        abort_reason = []
+        finished = threading.Event()
+
+        def _watch():
+            started = time.monotonic()
+            while not finished.wait(1):
+                now = time.monotonic()
+                if now - started > FFMPEG_TIMEOUT:
+                    abort_reason.append(f"Audio conversion timeout ({FFMPEG_TIMEOUT} seconds)")
+                elif now - last_progress[0] > FFMPEG_STALL_TIMEOUT:
+                    abort_reason.append(f"Audio conversion stalled: no progress for {FFMPEG_STALL_TIMEOUT} seconds")
+                else:
+                    continue
+                proc.kill()
+                return
+
+        watchdog = threading.Thread(target=_watch, daemon=True)
+        watchdog.start()
+
+        audio_size = 0
+        pending = None
+        try:
+            for segment in iter(lambda: proc.stdout.read(segment_bytes), b''):
+                audio_size += len(segment)
+                if pending is not None:
+                    if len(segment) < segment_bytes // 4:
+                        # 末尾分段过短，并入上一段
+                        pending += segment
+                        continue
+                    yield pending
+                pending = segment
 
-            if result.returncode != 0:
-                self.logger.error("Audio conversion failed:")
-                self.logger.error(f"Error output: {result.stderr}")
-                return None
+            proc.wait()
+            stderr_reader.join()
 
-            # 检查输出文件是否存在且大小大于10KB
-            if not mp3_file.exists():
-                self.logger.error("MP3 file not generated")
-                return None
+            if abort_reason:
+                raise RuntimeError(abort_reason[0])
 
-            file_size = mp3_file.stat().st_size
-            if file_size <= 10 * 1024:  # 10KB
-                self.logger.error(f"MP3 file too small: {file_size} bytes, possibly empty")
-                return None
+            if proc.returncode != 0:
+                error_output = '\n'.join(error_lines)
+                raise RuntimeError(f"Audio conversion failed: {error_output}")
+
+            # 检查音频数据大小（大于10KB）
+            if audio_size <= 10 * 1024:  # 10KB
+                raise RuntimeError(f"Audio data too small: {audio_size} bytes, possibly empty")
+
+            if pending is not None:
+                yield pending
 
             self.logger.info("Audio conversion completed:")
-            self.logger.info(f"File size: {file_size / 1024 / 1024:.2f} MB")
+            self.logger.info("Audio size: %.2f MB", audio_size / 1024 / 1024)
 
-            return str(mp3_file)
+        finally:
+            finished.set()
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+
+    def _probe_duration(self, video_path: str) -> Optional[float]:
+        """
+        使用ffprobe获取视频时长
+
+        Args:
+            video_path: 视频文件路径
 
-        except subprocess.TimeoutExpired:
-            self.logger.error("Audio conversion timeout (600 seconds)")
+        Returns:
+            float|None: 视频时长（秒），获取失败时返回None
+        """
+        cmd = ['ffprobe', '-v', 'quiet', '-show_entries', 'format=duration', '-of', 'csv=p=0', video_path]
+        try:
+            result = subprocess.run(cmd, capture_output=True, timeout=60)
+            return float(result.stdout.strip())
+        except (OSError, subprocess.TimeoutExpired, ValueError) as e:
+            self.logger.warning(f"Failed to probe video duration: {e}")
             return None
-        except Exception as e:
-            self.logger.error(f"Error during audio conversion: {e}")
+
+    def _plan_sample_windows(self, video_path: str) -> List[Tuple[Optional[float], Optional[float]]]:
+        """
+        规划需要识别的音频时段
+
+        未配置FALLBACK_MAX_AUDIO_SECONDS或视频时长未超过上限时识别完整音轨；
+        否则在视频中均匀选取若干时段，总时长不超过上限。
+
+        Args:
+            video_path: 视频文件路径
+
+        Returns:
+            List[Tuple[float|None, float|None]]: (起始时间, 时长) 列表，完整音轨为 [(None, None)]
+        """
+        if self.max_audio_seconds <= 0:
+            return [(None, None)]
+
+        total = self._probe_duration(video_path)
+        if total is None or total <= self.max_audio_seconds:
+            return [(None, None)]
+
+        window = self.max_audio_seconds / SAMPLE_WINDOWS
+        windows = []
+        for i in range(SAMPLE_WINDOWS):
+            center = total * (i + 0.5) / SAMPLE_WINDOWS
+            windows.append((max(center - window / 2, 0.0), window))
+
+        self.logger.info("Video duration %.0fs exceeds %ds, sampling %d windows of %.0fs",
+                         total, self.max_audio_seconds, SAMPLE_WINDOWS, window)
+        return windows
+
+    def transcribe_video(self, video_path: str) -> Optional[List[str]]:
+        """
+        转码与语音识别重叠执行：每产出一段音频就提交识别，最后按分段顺序合并
+
+        视频过长且配置了FALLBACK_MAX_AUDIO_SECONDS时只识别均匀选取的若干时段，
+        各时段的结果之间以换行分隔。
+
+        Args:
+            video_path: 视频文件路径
+
+        Returns:
+            List[str]|None: 每个声道的识别结果文本，失败时返回None
+        """
+        windows = self._plan_sample_windows(video_path)
+
+        recognize_pool = self._get_recognize_pool()
+        # 每个时段对应一组按顺序排列的识别任务
+        window_futures = []
+        try:
+            for start, duration in windows:
+                futures = []
+                window_futures.append(futures)
+                for segment in self.stream_audio_segments(video_path, start=start, duration=duration):
+                    futures.append(recognize_pool.submit(self.speech_to_text, segment))
+        except RuntimeError as e:
+            self.logger.error(str(e))
+            for futures in window_futures:
+                for future in futures:
+                    future.cancel()
+            return None
+
+        window_results = [[future.result() for future in futures] for futures in window_futures]
+        segment_count = sum(len(results) for results in window_results)
+
+        if any(result is None for results in window_results for result in results):
             return None
 
-    def speech_to_text(self, mp3_path: str) -> Optional[List[str]]:
+        self.logger.info("Speech recognition completed for %d audio segments", segment_count)
+
+        # 按声道合并各分段的识别结果，不同时段之间以换行分隔
+        return self._merge_channels([self._merge_channels(results) for results in window_results], '\n')
+
+    @staticmethod
+    def _merge_channels(segment_results: List[List[str]], separator: str = '') -> List[str]:
+        """按声道拼接各分段的识别结果"""
+        channel_texts = []
+        for results in segment_results:
+            for channel, text in enumerate(results):
+                if channel == len(channel_texts):
+                    channel_texts.append([])
+                channel_texts[channel].append(text)
+
+        return [separator.join(texts) for texts in channel_texts]
+
+    def speech_to_text(self, audio: Union[str, bytes]) -> Optional[List[str]]:
         """
-        将音频文件转换为文字
+        将音频转换为文字
 
         Args:
-            mp3_path: MP3文件路径
+            audio: MP3文件路径，或内存中的PCM音频数据（16kHz、16bit、单声道）
 
         Returns:
             List[str]|None: 识别结果文本列表，失败时返回None
         """
         self.logger.info("Starting speech-to-text:")
-        self.logger.info(f"Audio file: {mp3_path}")
+        if isinstance(audio, str):
+            self.logger.info("Audio file: %s", audio)
+        else:
+            self.logger.info("Audio data: %d bytes", len(audio))
 
         try:
             # 使用腾讯云SDK进行语音识别
-            results = recognize_speech_from_mp3(mp3_path)
+            with self._api_sema:
+                if isinstance(audio, str):
+                    results = recognize_speech_from_mp3(audio)
+                else:
+                    results = recognize_speech_from_bytes(audio, "pcm")
 
             if not results:
                 self.logger.warning("Speech recognition result is empty")
                 return []
 
             self.logger.info("Speech recognition completed:")
-            self.logger.info(f"Recognized {len(results)} channel results")
+            self.logger.info("Recognized %d channel results", len(results))
 
-            for i, text in enumerate(results, 1):
-                self.logger.info(f"Channel {i}: {text[:100]}...")  # Only show first 100 characters
+            if self.logger.isEnabledFor(logging.INFO):
+                for i, text in enumerate(results, 1):
+                    self.logger.info("Channel %d: %s...", i, text[:100])  # Only show first 100 characters
 
             return results
 
@@ -374,10 +700,10 @@ class VideoFallbackProcessor:
         # 1. 确定日期目录
         if report_date is None:
             date_str = datetime.now().strftime('%Y%m%d')
-            self.logger.info(f"Using current date: {date_str}")
+            self.logger.info("Using current date: %s", date_str)
         else:
             date_str = report_date
-            self.logger.info(f"Using provided report date: {date_str}")
+            self.logger.info("Using provided report date: %s", date_str)
 
         # 2. 下载视频
         video_path = self.download_video(bvid, date_str)
@@ -385,21 +711,70 @@ class VideoFallbackProcessor:
             self.logger.error("Video download failed, fallback process terminated")
             return None
 
-        # 3. 转换为音频
-        mp3_path = self.convert_to_mp3(video_path)
-        if not mp3_path:
-            self.logger.error("Audio conversion failed, fallback process terminated")
-            return None
-
-        # 4. 语音转文字
-        text_results = self.speech_to_text(mp3_path)
+        # 3. 转换为音频并进行语音识别（转码与识别重叠执行，音频不落盘）
+        text_results = self.transcribe_video(video_path)
         if text_results is None:
             self.logger.error("Speech recognition failed, fallback process terminated")
             return None
 
-        # 5. 保存语音转写结果到文件
+        # 4. 保存语音转写结果到文件
         if text_results:
             self.save_voice_output(text_results, date_str)
 
         self.logger.info("Video fallback processing workflow completed")
-        return text_results
\ No newline at end of file
+        return text_results
+
+    async def process_video_fallback_async(self, bvid: str, video_info: Dict,
+                                           report_date: str = None) -> Optional[List[str]]:
+        """
+        process_video_fallback 的异步版本，在线程中执行，不阻塞事件循环
+
+        可配合 asyncio.gather 并发处理多个视频，并发度仍受ffmpeg与语音识别的信号量限制。
+
+        Args:
+            bvid: BV号
+            video_info: 视频信息
+            report_date: 早报日期字符串(YYYYMMDD格式)，如果为None则使用当前日期
+
+        Returns:
+            List[str]|None: 识别的文字结果，失败时返回None
+        """
+        return await asyncio.to_thread(self.process_video_fallback, bvid, video_info, report_date)
+
+    def process_many(self, items: List[Tuple[str, Dict]]) -> Dict[str, Optional[List[str]]]:
+        """
+        并发执行多个视频的兜底处理流程
+
+        Args:
+            items: (BV号, 视频信息) 列表，视频信息中的pubdate用于确定日期目录
+
+        Returns:
+            Dict[str, List[str]|None]: BV号到识别结果的映射，失败的视频对应None
+        """
+        if not items:
+            return {}
+
+        self.logger.info("Starting batch video fallback processing for %d videos", len(items))
+
+        with ThreadPoolExecutor(max_workers=len(items)) as pool:
+            futures = {}
+            for bvid, video_info in items:
+                pubdate = video_info.get('pubdate')
+                report_date = datetime.fromtimestamp(pubdate).strftime('%Y%m%d') if pubdate else None
+                futures[bvid] = pool.submit(self.process_video_fallback, bvid, video_info, report_date)
+
+            results = {}
+            for bvid, future in futures.items():
+                # 单个视频出现未预期的异常时只记为失败，不影响其他视频的结果
+                try:
+                    results[bvid] = future.result()
+                except Exception as e:
+                    self.logger.error("Video fallback processing failed for %s: %s", bvid, e)
+                    results[bvid] = None
+
+        # 批量处理结束后释放识别线程池，避免空闲线程常驻
+        self.close()
+
+        failed = sum(1 for result in results.values() if result is None)
+        self.logger.info("Batch video fallback processing completed: %d succeeded, %d failed", len(results) - failed, failed)
+        return results
@@ -5,198 +5,240 @@
 用于生成完整的静态前端网站，与frontend/保持一致的页面风格
 """
 
+import hashlib
+import io
 import json
 import os
 import re
 import shutil
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from html import escape
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, TextIO, Tuple
 import markdown
 
-from .logger import get_logger
-
-
-class WebGenerator:
-    """静态前端生成器"""
-
-    def __init__(self, docs_dir: str, output_dir: str, homepage_page_size: int = 15):
-        """初始化生成器
-
-        Args:
-            docs_dir: 源文档目录路径
-            output_dir: 输出目录路径
-            homepage_page_size: 首页显示的早报数量，默认15条
-        """
-        # 使用统一的日志器
-        self.logger = get_logger()
-
-        self.docs_dir = Path(docs_dir)
-        self.output_dir = Path(output_dir)
-        self.page_size = homepage_page_size  # 首页显示数量
-        self.detail_page_size = 20  # 列表页每页显示数量
-
-        # 确保输出目录存在
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-
-        # 创建必要的子目录
-        (self.output_dir / "detail").mkdir(exist_ok=True)
-        (self.output_dir / "archive").mkdir(exist_ok=True)
-        (self.output_dir / "data").mkdir(exist_ok=True)
-
-    def _parse_filename(self, filename: str) -> Dict:
-        """解析文件名获取信息"""
-        # 文件名格式: 日期_AI早报_BV号.md (新格式)
-        match = re.match(r'(\d{4}-\d{2}-\d{2})_AI早报_([^\.]+)\.md', filename)
-        if match:
-            return {
-                'bv_id': match.group(2),
-                'date': match.group(1),
-                'filename': filename
-            }
-
-        # 兼容旧格式: BV号_日期_AI早报.md
-        match_old = re.match(r'([^_]+)_(\d{4}-\d{2}-\d{2})_AI早报\.md', filename)
-        if match_old:
-            return {
-                'bv_id': match_old.group(1),
-                'date': match_old.group(2),
-                'filename': filename
-            }
-
-        return None
-
-    def _parse_markdown_file(self, filepath: str) -> Dict:
-        """解析markdown文件内容"""
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # 提取标题
-            title_match = re.search(r'^# (.+)$', content, re.MULTILINE)
-            title = title_match.group(1) if title_match else '未知标题'
-
-            # 提取发布日期
-            date_match = re.search(r'\*\*📅 发布日期：\*\* (\d{4}-\d{2}-\d{2})', content)
-            publish_date = date_match.group(1) if date_match else None
-
-            # 提取BV号
-            bv_match = re.search(r'\*\*🎬 BV号：\*\* ([^\n]+)', content)
-            bv_id = bv_match.group(1) if bv_match else None
-
-            # 提取整理时间
-            time_match = re.search(r'\*\*📝 整理时间：\*\* ([^\n]+)', content)
-            organize_time = time_match.group(1) if time_match else None
-
-            # 提取资讯数量
-            count_match = re.search(r'\*\*📊 资讯数量：\*\* (\d+)', content)
-            news_count = int(count_match.group(1)) if count_match else 0
-
-            # 检查是否为语音转写生成
-            is_voice_generated = '语音转写生成' in content
-
-            # 提取概览
-            overview_match = re.search(r'## 📋 本期概览\n\n(.+?)\n\n---', content, re.DOTALL)
-            overview = overview_match.group(1).strip() if overview_match else ''
-
-            # 转换为HTML并移除第一个h1标题以避免二次渲染
-            html_content = markdown.markdown(
-                content,
-                extensions=[
-                    'extra',
-                    'codehilite',
-                    'tables',
-                    'toc',
-                    'fenced_code',
-                    'nl2br',
-                    'attr_list',
-                    'def_list',
-                    'footnotes',
-                    'admonition'
-                ],
-                extension_configs={
-                    'codehilite': {
-                        'css_class': 'highlight',
-                        'use_pygments': True
-                    }
-                }
-            )
-
-            # 移除第一个h1标签以避免在详情页面二次渲染标题
-            html_content = re.sub(r'<h1[^>]*>.*?</h1>', '', html_content, count=1, flags=re.DOTALL)
-
-            # 移除原有的元数据信息（发布日期、BV号、整理时间、资讯数量）和后面的分隔符
-            # 匹配从<strong>📅 发布日期：</strong>开始到<strong>📊 资讯数量：</strong> ... 条</p>以及后面的<hr />，同时清理多余的换行
-            metadata_pattern = r'<p><strong>📅 发布日期：</strong>.*?<strong>📊 资讯数量：</strong>\s*\d+\s*条</p>\s*<hr\s*/?>'
-            html_content = re.sub(metadata_pattern, '', html_content, flags=re.DOTALL)
-
-            # 清理开头的多余空白字符
-            html_content = html_content.lstrip()
-
-            return {
-                'title': title,
-                'publish_date': publish_date,
-                'bv_id': bv_id,
-                'organize_time': organize_time,
-                'news_count': news_count,
-                'overview': overview,
-                'content': content,
-                'html_content': html_content,
-                'is_voice_generated': is_voice_generated
-            }
-        except Exception as e:
-            self.logger.error(f"解析文件失败 {filepath}: {e}")
-            return None
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时回退到标准库 json
+    orjson = None
 
-    def _load_newspapers(self) -> List[Dict]:
-        """加载所有早报数据"""
-        newspapers = []
-
-        if not self.docs_dir.exists():
-            self.logger.warning(f"文档目录不存在: {self.docs_dir}")
-            return newspapers
-
-        # 遍历docs目录下的所有markdown文件
-        for filename in os.listdir(self.docs_dir):
-            if filename.endswith('.md'):
-                file_info = self._parse_filename(filename)
-                if file_info:
-                    filepath = self.docs_dir / filename
-                    newspaper_data = self._parse_markdown_file(filepath)
+from .logger import get_logger
+from .modules.report_markdown import (
+    BV_RE, COUNT_RE, DATE_RE, FILENAME_RE_NEW, FILENAME_RE_OLD, H1_RE, HTML_METADATA_RE,
+    OVERVIEW_RE, TIME_RE, TITLE_RE, create_markdown, has_code_block, strip_header,
+)
+
+# markdown解析缓存文件名及版本，解析/渲染逻辑变化时需要递增版本号
+_PARSE_CACHE_FILENAME = '.parse_cache.json'
+_PARSE_CACHE_VERSION = 5
+
+# 需要解析的文件数达到该值时使用多进程并行渲染
+_PARALLEL_PARSE_MIN_FILES = 8
+
+# 头部元数据字段: (字段名, 行内标记, 正则)
+_METADATA_FIELDS = (
+    ('title', '# ', TITLE_RE),
+    ('publish_date', '📅 发布日期', DATE_RE),
+    ('bv_id', '🎬 BV号', BV_RE),
+    ('organize_time', '📝 整理时间', TIME_RE),
+    ('news_count', '📊 资讯数量', COUNT_RE),
+)
+
+# 进程内共享的Markdown渲染器，按是否需要代码高亮区分（每个解析进程各自初始化）
+_markdown_renderers = {}
+
+
+def _link_or_copy(src: str, dst: str):
+    """创建硬链接，跨文件系统等无法链接的情况回退为复制"""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _sync_tree(src: Path, dst: Path):
+    """增量同步目录：只链接/复制新增或变化的文件，并删除源目录中已不存在的文件
+
+    以 (size, mtime_ns) 判断文件是否变化；硬链接和copy2都会保留源文件的mtime
+
+    Args:
+        src: 源目录
+        dst: 目标目录
+    """
+    for dirpath, dirnames, filenames in os.walk(src):
+        rel_dir = os.path.relpath(dirpath, src)
+        target_dir = dst / rel_dir
+        target_dir.mkdir(parents=True, exist_ok=True)
+
+        # 删除目标目录中源目录已不存在的文件和子目录
+        keep = set(dirnames).union(filenames)
+        with os.scandir(target_dir) as it:
+            for entry in it:
+                if entry.name not in keep:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.unlink(entry.path)
+
+        for filename in filenames:
+            src_file = os.path.join(dirpath, filename)
+            dst_file = os.path.join(target_dir, filename)
+            src_stat = os.stat(src_file)
+            try:
+                dst_stat = os.stat(dst_file)
+            except FileNotFoundError:
+                pass
+            else:
+                if (dst_stat.st_size, dst_stat.st_mtime_ns) == (src_stat.st_size, src_stat.st_mtime_ns):
+                    continue
+                os.unlink(dst_file)
+            _link_or_copy(src_file, dst_file)
+
+
+def _dump_json(data) -> bytes:
+    """以紧凑格式序列化JSON，优先使用orjson"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _content_hash(data: bytes) -> str:
+    """计算输出内容的摘要，用于判断文件是否需要重写"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _get_markdown(highlight: bool = True) -> markdown.Markdown:
+    """获取当前进程共享的Markdown渲染器，扩展只在首次调用时初始化
+
+    Args:
+        highlight: 是否需要代码高亮；不含代码块的文档使用不加载codehilite/Pygments的轻量渲染器
+    """
+    renderer = _markdown_renderers.get(highlight)
+    if renderer is None:
+        renderer = create_markdown(highlight)
+        _markdown_renderers[highlight] = renderer
+    return renderer
+
+
+def _scan_metadata(content: str) -> Tuple[Dict[str, Optional[re.Match]], int]:
+    """单次扫描第一个分隔线之前的头部区域，提取各元数据字段
+
+    Args:
+        content: markdown文件内容
+
+    Returns:
+        Tuple[Dict, int]: 各字段的匹配结果，以及头部区域的结束位置
+    """
+    head = content.partition('\n\n---')[0]
+    matches = dict.fromkeys(key for key, _, _ in _METADATA_FIELDS)
+
+    # 逐行按标记分派，只对包含该标记的行执行正则
+    for line in head.split('\n'):
+        for key, marker, pattern in _METADATA_FIELDS:
+            if matches[key] is None and marker in line:
+                matches[key] = pattern.search(line)
+
+    # 头部中缺失的字段再到正文中查找，保持与全文搜索一致
+    for key, _, pattern in _METADATA_FIELDS:
+        if matches[key] is None:
+            matches[key] = pattern.search(content, len(head))
+
+    head_end = 0 if '## 📋 本期概览' in head else len(head)
+    return matches, head_end
+
+
+def _parse_markdown(filepath: str) -> Dict:
+    """解析markdown文件内容并渲染为HTML，解析失败时抛出异常
+
+    定义为模块级函数，便于在多进程中并行执行
+    """
+    # 整体读取字节后一次性解码，绕过文本IO层；与文本模式一样统一换行符
+    content = Path(filepath).read_bytes().decode('utf-8')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+
+    # 单次扫描头部元数据区域，提取标题、发布日期、BV号、整理时间、资讯数量
+    metadata, head_end = _scan_metadata(content)
+
+    title_match = metadata['title']
+    title = title_match.group(1) if title_match else '未知标题'
+
+    date_match = metadata['publish_date']
+    publish_date = date_match.group(1) if date_match else None
+
+    bv_match = metadata['bv_id']
+    bv_id = bv_match.group(1) if bv_match else None
+
+    time_match = metadata['organize_time']
+    organize_time = time_match.group(1) if time_match else None
+
+    count_match = metadata['news_count']
+    news_count = int(count_match.group(1)) if count_match else 0
+
+    # 检查是否为语音转写生成
+    is_voice_generated = '语音转写生成' in content
+
+    # 提取概览（概览位于头部元数据之后）
+    overview_match = OVERVIEW_RE.search(content, head_end)
+    overview = overview_match.group(1).strip() if overview_match else ''
+
+    # 转换为HTML，标题和元数据在详情页面中单独渲染，需要去掉；复用渲染器前需要reset
+    body = strip_header(content)
+    md = _get_markdown(highlight=has_code_block(content if body is None else body))
+    md.reset()
+    html_content = md.convert(content if body is None else body)
+
+    if body is None:
+        # 头部不是标准格式时回退到HTML清理：移除第一个h1标签以避免在详情页面二次渲染标题
+        html_content = H1_RE.sub('', html_content, count=1)
 
-                    if newspaper_data:
-                        # 合并文件信息和解析内容
-                        newspaper_data.update(file_info)
-                        # 只添加有咨询的文件，跳过0个咨询的文件
-                        if newspaper_data.get('news_count', 0) > 0:
-                            newspapers.append(newspaper_data)
+        # 移除原有的元数据信息（发布日期、BV号、整理时间、资讯数量）和后面的分隔符
+        # 匹配从<strong>📅 发布日期：</strong>开始到<strong>📊 资讯数量：</strong> ... 条</p>以及后面的<hr />，同时清理多余的换行
+        html_content = HTML_METADATA_RE.sub('', html_content)
+
+    # 清理开头的多余空白字符
+    html_content = html_content.lstrip()
 
-        # 按日期排序（最新的在前面）
-        newspapers.sort(key=lambda x: x.get('publish_date', ''), reverse=True)
+    return {
+        'title': title,
+        'publish_date': publish_date,
+        'bv_id': bv_id,
+        'organize_time': organize_time,
+        'news_count': news_count,
+        'overview': overview,
+        # 卡片中使用的转义标题和概览摘要，在解析阶段预先计算
+        'title_escaped': escape(title),
+        'overview_preview': escape(overview[:150]),
+        'content': content,
+        'html_content': html_content,
+        'is_voice_generated': is_voice_generated
+    }
 
-        return newspapers
 
-    def _generate_html_index(self, newspapers: List[Dict]) -> str:
-        """生成首页HTML内容"""
-        # 计算分页数据
-        total_count = len(newspapers)
-        # 确保首页显示偶数个卡片，如果page_size是奇数则减1
-        home_page_size = self.page_size if self.page_size % 2 == 0 else self.page_size - 1
-        first_page = newspapers[:home_page_size]
+def _render_card(newspaper: Dict, href_prefix: str = '', show_voice_badge: bool = True) -> str:
+    """生成早报卡片HTML，首页和归档页共用
 
-        # 生成早报卡片HTML
-        cards_html = ""
-        for newspaper in first_page:
-            escape_html = lambda text: str(text).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;').replace("'", '&#x27;')
+    Args:
+        newspaper: 早报数据，标题和概览摘要已在解析阶段转义
+        href_prefix: 详情页链接前缀，归档页位于子目录中需要传入 '../'
+        show_voice_badge: 是否为语音转写生成的早报显示标识
 
-            # 检查是否为语音转写生成并添加标识
-            voice_badge = '<i class="fas fa-microphone voice-badge"></i>' if newspaper.get('is_voice_generated', False) else ''
+    Returns:
+        str: 卡片HTML
+    """
+    # 检查是否为语音转写生成并添加标识
+    voice_badge = ''
+    if show_voice_badge and newspaper.get('is_voice_generated', False):
+        voice_badge = '\n                        <i class="fas fa-microphone voice-badge"></i>'
 
-            cards_html += f"""
-        <div class="newspaper-card" onclick="window.location.href='detail/{newspaper['publish_date']}.html'">
+    return f"""
+        <div class="newspaper-card" onclick="window.location.href='{href_prefix}detail/{newspaper['publish_date']}.html'">
             <div class="newspaper-header">
-                <h3 class="newspaper-title">{escape_html(newspaper['title'] or '未知标题')}</h3>
+                <h3 class="newspaper-title">{newspaper['title_escaped']}</h3>
                 <div class="newspaper-meta">
                     <div class="meta-item">
                         <i class="fas fa-calendar"></i>
@@ -204,13 +246,12 @@ class WebGenerator:
                     </div>
                     <div class="meta-item">
                         <i class="fas fa-video"></i>
-                        <span>{newspaper['bv_id'] or '未知BV号'}</span>
-                        {voice_badge}
+                        <span>{newspaper['bv_id'] or '未知BV号'}</span>{voice_badge}
                     </div>
                 </div>
             </div>
             <div class="newspaper-overview">
-                {escape_html((newspaper['overview'] or '')[:150])}...
+                {newspaper['overview_preview']}...
             </div>
             <div class="newspaper-stats">
                 <div class="stats-count">
@@ -223,8 +264,11 @@ class WebGenerator:
             </div>
         </div>"""
 
-        # 生成完整的HTML页面
-        html_content = """<!DOCTYPE html>
+
+# ============= 首页模板 =============
+# 首页HTML按固定片段依次写入文件，片段之间依次是：早报总数、卡片列表、加载更多按钮、每页数量、早报总数
+
+_INDEX_HEAD = """<!DOCTYPE html>
 <html lang="zh-CN">
 <head>
     <meta charset="UTF-8">
@@ -342,17 +386,25 @@ class WebGenerator:
                         刷新
                     </button>
                     <div class="stats">
-                        <span id="total-count">共 """ + str(total_count) + """ 条早报</span>
+                        <span id="total-count">共 """
+
+_INDEX_LIST_OPEN = """ 条早报</span>
                     </div>
                 </div>
 
                 <!-- 早报列表 -->
                 <div id="newspapers-list" class="newspapers-list">
-                    {cards_html}
+                    """
+
+_INDEX_LIST_CLOSE = """
                 </div>
 
                 <!-- 查看更多按钮 -->
-                """ + ('<div class="load-more-container"><button class="btn-load-more" onclick="loadMore()"><i class="fas fa-plus-circle"></i> <span>加载更多</span></button></div>' if total_count > self.page_size else '') + """
+                """
+
+_INDEX_LOAD_MORE = '<div class="load-more-container"><button class="btn-load-more" onclick="loadMore()"><i class="fas fa-plus-circle"></i> <span>加载更多</span></button></div>'
+
+_INDEX_SCRIPT_HEAD = """
             </div>
 
             <!-- 详情视图 -->
@@ -394,8 +446,12 @@ class WebGenerator:
 
     <script>
         let currentPage = 1;
-        let pageSize = """ + str(self.page_size) + """;
-        let totalCount = """ + str(total_count) + """;
+        let pageSize = """
+
+_INDEX_SCRIPT_TOTAL = """;
+        let totalCount = """
+
+_INDEX_TAIL = """;
         let isLoading = false;
 
         // 工具函数
@@ -526,7 +582,243 @@ class WebGenerator:
 </body>
 </html>"""
 
-        return html_content.replace('{cards_html}', cards_html)
+
+class WebGenerator:
+    """静态前端生成器"""
+
+    def __init__(self, docs_dir: str, output_dir: str, homepage_page_size: int = 15):
+        """初始化生成器
+
+        Args:
+            docs_dir: 源文档目录路径
+            output_dir: 输出目录路径
+            homepage_page_size: 首页显示的早报数量，默认15条
+        """
+        # 使用统一的日志器
+        self.logger = get_logger()
+
+        self.docs_dir = Path(docs_dir)
+        self.output_dir = Path(output_dir)
+        self.page_size = homepage_page_size  # 首页显示数量
+        self.detail_page_size = 20  # 列表页每页显示数量
+
+        # 确保输出目录存在
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        # 创建必要的子目录
+        (self.output_dir / "detail").mkdir(exist_ok=True)
+        (self.output_dir / "archive").mkdir(exist_ok=True)
+        (self.output_dir / "data").mkdir(exist_ok=True)
+
+        # markdown解析结果缓存，按文件的 (mtime_ns, size) 判断是否需要重新解析；
+        # 缓存放在docs目录下，避免被提交到dist仓库
+        self._parse_cache_file = self.docs_dir / _PARSE_CACHE_FILENAME
+        self._parse_cache, self._output_hashes = self._load_parse_cache()
+        self._output_hashes_changed = False
+
+    def _load_parse_cache(self) -> Tuple[Dict, Dict]:
+        """加载markdown解析缓存及输出文件摘要，版本不一致或读取失败时返回空缓存
+
+        Returns:
+            (解析缓存, 输出文件相对路径到 [内容摘要, mtime_ns, size] 的映射)
+        """
+        try:
+            if orjson is not None:
+                cache = orjson.loads(self._parse_cache_file.read_bytes())
+            else:
+                with open(self._parse_cache_file, 'r', encoding='utf-8') as f:
+                    cache = json.load(f)
+        except (OSError, ValueError):
+            return {}, {}
+
+        if cache.get('version') != _PARSE_CACHE_VERSION:
+            return {}, {}
+        return cache.get('entries', {}), cache.get('outputs', {})
+
+    def _save_parse_cache(self):
+        """保存markdown解析缓存"""
+        try:
+            self._parse_cache_file.write_bytes(_dump_json({
+                'version': _PARSE_CACHE_VERSION,
+                'entries': self._parse_cache,
+                'outputs': self._output_hashes,
+            }))
+        except OSError as e:
+            self.logger.warning(f"保存解析缓存失败 {self._parse_cache_file}: {e}")
+
+    def _write_output(self, filepath: Path, data: bytes) -> bool:
+        """写入输出文件，内容与上次生成一致且文件未被改动时跳过写入
+
+        跳过写入可以保持文件mtime不变，避免无意义的磁盘写入和CDN缓存失效。
+        文件的 (mtime_ns, size) 与上次写入时不一致（被手动修改、替换或输出到
+        其他目录）时仍会重新写入。
+
+        Args:
+            filepath: 输出文件路径
+            data: 文件内容
+
+        Returns:
+            是否实际写入了文件
+        """
+        key = filepath.relative_to(self.output_dir).as_posix()
+        digest = _content_hash(data)
+        cached = self._output_hashes.get(key)
+        if cached is not None and cached[0] == digest:
+            try:
+                st = filepath.stat()
+            except OSError:
+                st = None
+            if st is not None and [st.st_mtime_ns, st.st_size] == cached[1:]:
+                return False
+
+        filepath.write_bytes(data)
+        st = filepath.stat()
+        self._output_hashes[key] = [digest, st.st_mtime_ns, st.st_size]
+        self._output_hashes_changed = True
+        return True
+
+    def _parse_filename(self, filename: str) -> Dict:
+        """解析文件名获取信息"""
+        # 文件名格式: 日期_AI早报_BV号.md (新格式)
+        match = FILENAME_RE_NEW.match(filename)
+        if match:
+            return {
+                'bv_id': match.group(2),
+                'date': match.group(1),
+                'filename': filename
+            }
+
+        # 兼容旧格式: BV号_日期_AI早报.md
+        match_old = FILENAME_RE_OLD.match(filename)
+        if match_old:
+            return {
+                'bv_id': match_old.group(1),
+                'date': match_old.group(2),
+                'filename': filename
+            }
+
+        return None
+
+    def _parse_markdown_file(self, filepath: str) -> Dict:
+        """解析markdown文件内容"""
+        try:
+            return _parse_markdown(filepath)
+        except Exception as e:
+            self.logger.error(f"解析文件失败 {filepath}: {e}")
+            return None
+
+    def _parse_markdown_files(self, filepaths: List[str]) -> List[Optional[Dict]]:
+        """解析多个markdown文件，文件较多时使用多进程并行渲染
+
+        Args:
+            filepaths: markdown文件路径列表
+
+        Returns:
+            List[Dict|None]: 与filepaths一一对应的解析结果，解析失败的文件为None
+        """
+        # 文件较少或只有单核时，进程启动开销大于并行收益，直接顺序解析
+        max_workers = min(os.cpu_count() or 1, len(filepaths))
+        if len(filepaths) < _PARALLEL_PARSE_MIN_FILES or max_workers <= 1:
+            return [self._parse_markdown_file(filepath) for filepath in filepaths]
+
+        results = []
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_parse_markdown, filepath) for filepath in filepaths]
+            for filepath, future in zip(filepaths, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    self.logger.error(f"解析文件失败 {filepath}: {e}")
+                    results.append(None)
+
+        return results
+
+    def _load_newspapers(self) -> List[Dict]:
+        """加载所有早报数据"""
+        newspapers = []
+
+        if not self.docs_dir.exists():
+            self.logger.warning(f"文档目录不存在: {self.docs_dir}")
+            return newspapers
+
+        # 遍历docs目录下的所有markdown文件，未变化的文件直接使用解析缓存
+        entries = []
+        pending = []
+        with os.scandir(self.docs_dir) as dir_entries:
+            for dir_entry in dir_entries:
+                filename = dir_entry.name
+                if not filename.endswith('.md'):
+                    continue
+                file_info = self._parse_filename(filename)
+                if file_info:
+                    stat = dir_entry.stat()
+                    cache_key = [stat.st_mtime_ns, stat.st_size]
+
+                    cached = self._parse_cache.get(filename)
+                    if cached and cached['key'] == cache_key:
+                        entries.append([filename, file_info, cache_key, cached['data']])
+                    else:
+                        entry = [filename, file_info, cache_key, None]
+                        entries.append(entry)
+                        pending.append((entry, dir_entry.path))
+
+        # 解析缓存未命中的文件
+        parsed_results = self._parse_markdown_files([filepath for _, filepath in pending])
+        for (entry, _), parsed in zip(pending, parsed_results):
+            entry[3] = parsed
+
+        cache_entries = {}
+        for filename, file_info, cache_key, parsed in entries:
+            if parsed:
+                cache_entries[filename] = {'key': cache_key, 'data': parsed}
+                # 合并文件信息和解析内容（复制一份，避免修改缓存）
+                newspaper_data = dict(parsed)
+                newspaper_data.update(file_info)
+                # 只添加有咨询的文件，跳过0个咨询的文件
+                if newspaper_data.get('news_count', 0) > 0:
+                    # 预先计算排序键，该字段不会导出到JSON数据文件
+                    newspaper_data['_sort_key'] = newspaper_data.get('publish_date') or ''
+                    newspapers.append(newspaper_data)
+
+        # 只保留仍然存在的文件，缓存有变化时写回磁盘
+        if cache_entries != self._parse_cache:
+            self._parse_cache = cache_entries
+            self._save_parse_cache()
+
+        # 按日期排序（最新的在前面）
+        newspapers.sort(key=itemgetter('_sort_key'), reverse=True)
+
+        return newspapers
+
+    def _write_html_index(self, newspapers: List[Dict], fp: TextIO):
+        """生成首页HTML内容，分块直接写入文件
+
+        Args:
+            newspapers: 按日期倒序排列的早报列表
+            fp: 已打开的首页文件
+        """
+        # 计算分页数据
+        total_count = len(newspapers)
+        # 确保首页显示偶数个卡片，如果page_size是奇数则减1
+        home_page_size = self.page_size if self.page_size % 2 == 0 else self.page_size - 1
+        first_page = newspapers[:home_page_size]
+
+        # 生成早报卡片HTML
+        cards = [_render_card(newspaper) for newspaper in first_page]
+
+        # 按模板片段依次写入完整的HTML页面
+        fp.write(_INDEX_HEAD)
+        fp.write(str(total_count))
+        fp.write(_INDEX_LIST_OPEN)
+        fp.writelines(cards)
+        fp.write(_INDEX_LIST_CLOSE)
+        if total_count > self.page_size:
+            fp.write(_INDEX_LOAD_MORE)
+        fp.write(_INDEX_SCRIPT_HEAD)
+        fp.write(str(self.page_size))
+        fp.write(_INDEX_SCRIPT_TOTAL)
+        fp.write(str(total_count))
+        fp.write(_INDEX_TAIL)
 
     def _generate_detail_page(self, newspaper: Dict) -> str:
         """生成早报详情页面"""
@@ -667,16 +959,17 @@ class WebGenerator:
         frontend_static_dir = Path(__file__).parent.parent / "frontend" / "static"
         target_static_dir = self.output_dir / "static"
 
-        # 如果目标目录存在，先删除
-        if target_static_dir.exists():
-            shutil.rmtree(target_static_dir)
-
-        # 复制静态文件
-        shutil.copytree(frontend_static_dir, target_static_dir)
+        # 增量同步静态文件，未变化的文件不再处理；新文件优先使用硬链接避免复制文件内容
+        _sync_tree(frontend_static_dir, target_static_dir)
         self.logger.info(f"Static files copied to: {target_static_dir}")
 
-    def _generate_json_data(self, newspapers: List[Dict]):
-        """生成分页JSON数据文件"""
+    def _generate_json_data(self, newspapers: List[Dict], generated_time: str):
+        """生成分页JSON数据文件
+
+        Args:
+            newspapers: 按日期倒序排列的早报列表
+            generated_time: 本次生成时间，格式 YYYY-MM-DD HH:MM:SS
+        """
         data_dir = self.output_dir / "data"
 
         # 生成分页数据 - 实现奇偶数交替获取
@@ -695,7 +988,7 @@ class WebGenerator:
                 'page': page_num,
                 'total_pages': total_pages,
                 'total_count': len(newspapers),
-                'generated_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                'generated_time': generated_time
             }
 
             for newspaper in page_newspapers:
@@ -710,14 +1003,29 @@ class WebGenerator:
                 }
                 page_data['newspapers'].append(simplified_data)
 
+            # 数据文件只供前端脚本读取，使用紧凑格式输出以减小体积
             json_filepath = data_dir / f'list_page_{page_num}.json'
-            with open(json_filepath, 'w', encoding='utf-8') as f:
-                json.dump(page_data, f, ensure_ascii=False, indent=2)
+            self._write_output(json_filepath, _dump_json(page_data))
 
         self.logger.info(f"Generated {total_pages} page data files in: {data_dir}")
 
-        # 生成详情页的单独数据文件（可选，用于SEO和搜索）
+    def _generate_detail_pages(self, newspapers: List[Dict]):
+        """生成所有早报的独立详情页面及对应的详情数据文件
+
+        两种输出都来自同一份早报数据，在一次遍历中生成
+        """
+        detail_dir = self.output_dir / "detail"
+        data_dir = self.output_dir / "data"
+
         for newspaper in newspapers:
+            # 生成详情页面
+            detail_html = self._generate_detail_page(newspaper)
+            filename = f"{newspaper.get('publish_date', 'unknown')}.html"
+
+            filepath = detail_dir / filename
+            self._write_output(filepath, detail_html.encode('utf-8'))
+
+            # 生成详情页的单独数据文件（可选，用于SEO和搜索）
             detail_data = {
                 'title': newspaper.get('title', ''),
                 'publish_date': newspaper.get('publish_date', ''),
@@ -730,42 +1038,26 @@ class WebGenerator:
             }
 
             json_filepath = data_dir / f'detail_{newspaper.get("publish_date", "")}.json'
-            with open(json_filepath, 'w', encoding='utf-8') as f:
-                json.dump(detail_data, f, ensure_ascii=False, indent=2)
-
-        self.logger.info(f"Generated {len(newspapers)} detail data files")
+            self._write_output(json_filepath, _dump_json(detail_data))
 
-    def _generate_detail_pages(self, newspapers: List[Dict]):
-        """生成所有早报的独立详情页面"""
-        detail_dir = self.output_dir / "detail"
-
-        for newspaper in newspapers:
-            # 生成详情页面
-            detail_html = self._generate_detail_page(newspaper)
-            filename = f"{newspaper.get('publish_date', 'unknown')}.html"
-
-            filepath = detail_dir / filename
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(detail_html)
-
-        self.logger.info(f"Generated {len(newspapers)} detail pages in: {detail_dir}")
+        self.logger.info(f"Generated {len(newspapers)} detail pages and detail data files in: {detail_dir}, {data_dir}")
 
     def _generate_archive_pages(self, newspapers: List[Dict]):
-        """生成归档页面"""
+        """生成归档页面
+
+        Args:
+            newspapers: 按日期倒序排列的早报列表，同一月份的早报相邻，可以单次遍历分组
+        """
         archive_dir = self.output_dir / "archive"
+        month_count = 0
+
+        # 按年月分组并为每个月生成归档页面（复用加载时计算的排序键，缺失发布日期时为空字符串）
+        for year_month, group in groupby(newspapers, key=lambda x: x['_sort_key'][:7]):
+            if len(year_month) < 7:  # YYYY-MM格式
+                continue
+            month_newspapers = list(group)
+            month_count += 1
 
-        # 按年月分组
-        by_year_month = {}
-        for newspaper in newspapers:
-            date = newspaper.get('publish_date', '')
-            if len(date) >= 7:  # YYYY-MM格式
-                year_month = date[:7]  # 取YYYY-MM
-                if year_month not in by_year_month:
-                    by_year_month[year_month] = []
-                by_year_month[year_month].append(newspaper)
-
-        # 为每个月生成归档页面
-        for year_month, month_newspapers in by_year_month.items():
             year = year_month[:4]
             month = year_month[5:7]
 
@@ -774,38 +1066,7 @@ class WebGenerator:
             year_dir.mkdir(exist_ok=True)
 
             # 生成月度归档页面
-            cards_html = ""
-            for newspaper in month_newspapers:
-                escape_html = lambda text: str(text).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;').replace("'", '&#x27;')
-
-                cards_html += f"""
-        <div class="newspaper-card" onclick="window.location.href='../detail/{newspaper['publish_date']}.html'">
-            <div class="newspaper-header">
-                <h3 class="newspaper-title">{escape_html(newspaper.get('title', '未知标题'))}</h3>
-                <div class="newspaper-meta">
-                    <div class="meta-item">
-                        <i class="fas fa-calendar"></i>
-                        <span>{newspaper.get('publish_date', '未知日期')}</span>
-                    </div>
-                    <div class="meta-item">
-                        <i class="fas fa-video"></i>
-                        <span>{newspaper.get('bv_id', '未知BV号')}</span>
-                    </div>
-                </div>
-            </div>
-            <div class="newspaper-overview">
-                {escape_html((newspaper.get('overview', '')[:150]))}...
-            </div>
-            <div class="newspaper-stats">
-                <div class="stats-count">
-                    <i class="fas fa-list"></i>
-                    {newspaper.get('news_count', 0)} 条资讯
-                </div>
-                <div style="color: #999; font-size: 12px;">
-                    {newspaper.get('organize_time', '')}
-                </div>
-            </div>
-        </div>"""
+            cards_html = "".join(_render_card(newspaper, '../', show_voice_badge=False) for newspaper in month_newspapers)
 
             archive_html = f"""<!DOCTYPE html>
 <html lang="zh-CN">
@@ -856,16 +1117,18 @@ class WebGenerator:
 </html>"""
 
             month_file = year_dir / f"{month}.html"
-            with open(month_file, 'w', encoding='utf-8') as f:
-                f.write(archive_html)
+            self._write_output(month_file, archive_html.encode('utf-8'))
 
-        self.logger.info(f"Generated archive pages for {len(by_year_month)} months in: {archive_dir}")
+        self.logger.info(f"Generated archive pages for {month_count} months in: {archive_dir}")
 
-    def _auto_git_commit(self):
+    def _auto_git_commit(self, current_date: str):
         """自动Git提交更新
 
         检查dist目录是否存在git仓库，如果存在则提交更新。
         提交信息格式: update: daily report auto update yyyy-mm-dd
+
+        Args:
+            current_date: 本次生成日期，格式 YYYY-MM-DD
         """
         dist_git_dir = self.output_dir / ".git"
         if not dist_git_dir.exists():
@@ -873,28 +1136,25 @@ class WebGenerator:
             return
 
         self.logger.info("Detected Git repository, committing updates...")
+        # 成功时不需要git的输出，丢弃stdout；只保留stderr原始字节，失败时再解码用于日志
+        git_output = {'stdout': subprocess.DEVNULL, 'stderr': subprocess.PIPE, 'cwd': self.output_dir}
         try:
-            # 获取当前日期
-            current_date = datetime.now().strftime("%Y-%m-%d")
-
             # 执行git add --all
-            subprocess.run(["git", "add", "--all"], check=True, capture_output=True, 
-                           text=True, cwd=self.output_dir)
+            subprocess.run(["git", "add", "--all"], check=True, **git_output)
             self.logger.info("All changes added to staging area")
 
             # 执行git commit
             commit_message = f"update: daily report auto update {current_date}"
-            subprocess.run(["git", "commit", "-m", commit_message], check=True, capture_output=True, 
-                           text=True, cwd=self.output_dir)
+            subprocess.run(["git", "commit", "-m", commit_message], check=True, **git_output)
             self.logger.info(f"Committed updates: {commit_message}")
 
             # 执行git push
-            subprocess.run(["git", "push"], check=True, capture_output=True, text=True, 
-                           cwd=self.output_dir, timeout=300)
+            subprocess.run(["git", "push"], check=True, timeout=300, **git_output)
             self.logger.info("Push completed successfully")
 
         except subprocess.CalledProcessError as e:
-            self.logger.error(f"Git operation failed: {e}")
+            stderr = e.stderr.decode('utf-8', errors='replace').strip() if e.stderr else ''
+            self.logger.error(f"Git operation failed: {e}" + (f"\n{stderr}" if stderr else ''))
         except Exception as e:
             self.logger.error(f"Error during Git commit process: {e}")
 
@@ -910,15 +1170,22 @@ class WebGenerator:
 
             self.logger.info(f"Found {len(newspapers)} newspaper files")
 
+            # 本次生成的时间，数据文件、站点地图、README和Git提交信息共用
+            now = datetime.now()
+            today = now.strftime('%Y-%m-%d')
+            generated_time = now.strftime('%Y-%m-%d %H:%M:%S')
+
             # 1. 生成首页HTML（仅包含最新15条数据）
             self.logger.info("Generating optimized homepage...")
-            index_html = self._generate_html_index(newspapers)
             index_filepath = self.output_dir / 'index.html'
-            with open(index_filepath, 'w', encoding='utf-8') as f:
-                f.write(index_html)
-            self.logger.info(f"Optimized homepage generated: {index_filepath}")
-
-            # 2. 生成所有独立详情页面
+            index_buffer = io.StringIO()
+            self._write_html_index(newspapers, index_buffer)
+            if self._write_output(index_filepath, index_buffer.getvalue().encode('utf-8')):
+                self.logger.info(f"Optimized homepage generated: {index_filepath}")
+            else:
+                self.logger.info(f"Homepage unchanged, skipped writing: {index_filepath}")
+
+            # 2. 生成所有独立详情页面及详情数据文件
             self.logger.info("Generating detail pages...")
             self._generate_detail_pages(newspapers)
 
@@ -928,7 +1195,7 @@ class WebGenerator:
 
             # 4. 生成分页数据文件
             self.logger.info("Generating paginated data files...")
-            self._generate_json_data(newspapers)
+            self._generate_json_data(newspapers, generated_time)
 
             # 5. 复制静态文件
             self.logger.info("Copying static files...")
@@ -936,13 +1203,13 @@ class WebGenerator:
 
             # 6. 生成站点地图（SEO优化）
             self.logger.info("Generating sitemap...")
-            self._generate_sitemap(newspapers)
+            self._generate_sitemap(newspapers, today)
 
             # 7. 生成README文件
             readme_content = f"""# AI早报静态网站（优化版本）
 
 ## 生成时间
-{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+{generated_time}
 
 ## 新特性
 ✅ **独立详情页面**: 每篇早报都有独立的URL和页面
@@ -997,13 +1264,17 @@ dist/
 """
 
             readme_filepath = self.output_dir / 'README.md'
-            with open(readme_filepath, 'w', encoding='utf-8') as f:
-                f.write(readme_content)
+            self._write_output(readme_filepath, readme_content.encode('utf-8'))
 
             self.logger.info(f"README file generated: {readme_filepath}")
 
+            # 输出文件摘要有变化时写回缓存
+            if self._output_hashes_changed:
+                self._save_parse_cache()
+                self._output_hashes_changed = False
+
             # 自动Git提交更新
-            self._auto_git_commit()
+            self._auto_git_commit(today)
 
             self.logger.info("✅ Static website generation completed successfully!")
             self.logger.info(f"📊 Generated {len(newspapers)} detail pages")
@@ -1016,56 +1287,64 @@ dist/
             self.logger.error(f"❌ Failed to generate static website: {e}")
             return False
 
-    def _generate_sitemap(self, newspapers: List[Dict]):
-        """生成站点地图（SEO优化）"""
+    def _generate_sitemap(self, newspapers: List[Dict], today: str):
+        """生成站点地图（SEO优化）
+
+        Args:
+            newspapers: 按日期倒序排列的早报列表（_load_newspapers 的返回值）
+            today: 本次生成日期，作为首页的lastmod
+        """
         base_url = "https://your-domain.com"  # 需要用户配置实际域名
 
-        sitemap_xml = '<?xml version="1.0" encoding="UTF-8"?>\n'
-        sitemap_xml += '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+        parts = [
+            '<?xml version="1.0" encoding="UTF-8"?>\n',
+            '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n',
+        ]
 
         # 添加首页
-        sitemap_xml += f"""
+        parts.append(f"""
   <url>
     <loc>{base_url}/</loc>
-    <lastmod>{datetime.now().strftime('%Y-%m-%d')}</lastmod>
+    <lastmod>{today}</lastmod>
     <changefreq>daily</changefreq>
     <priority>1.0</priority>
-  </url>"""
+  </url>""")
 
-        # 添加详情页面
+        # 添加详情页面，同时收集需要添加的归档月份；
+        # 早报已按日期倒序排列，同一月份相邻，按出现顺序去重即为倒序，无需再排序
+        detail_base_url = f"{base_url}/detail/"
+        archive_months = []
         for newspaper in newspapers:
-            date = newspaper.get('publish_date', '')
-            if date:
-                sitemap_xml += f"""
+            date = newspaper['_sort_key']
+            if not date:
+                continue
+            parts.append(f"""
   <url>
-    <loc>{base_url}/detail/{date}.html</loc>
+    <loc>{detail_base_url}{date}.html</loc>
     <lastmod>{date}</lastmod>
     <changefreq>never</changefreq>
     <priority>0.8</priority>
-  </url>"""
+  </url>""")
+            if len(date) >= 7 and (not archive_months or archive_months[-1] != date[:7]):
+                archive_months.append(date[:7])
 
         # 添加归档页面
-        archive_years = set()
-        for newspaper in newspapers:
-            date = newspaper.get('publish_date', '')
-            if len(date) >= 7:
-                archive_years.add(date[:7])
-
-        for year_month in sorted(archive_years, reverse=True):
+        archive_base_url = f"{base_url}/archive/"
+        for year_month in archive_months:
             year = year_month[:4]
             month = year_month[5:7]
-            sitemap_xml += f"""
+            parts.append(f"""
   <url>
-    <loc>{base_url}/archive/{year}/{month}.html</loc>
+    <loc>{archive_base_url}{year}/{month}.html</loc>
     <lastmod>{year_month}-01</lastmod>
     <changefreq>monthly</changefreq>
     <priority>0.6</priority>
-  </url>"""
+  </url>""")
 
-        sitemap_xml += '\n</urlset>'
+        parts.append('\n</urlset>')
+        sitemap_xml = "".join(parts)
 
         sitemap_filepath = self.output_dir / 'sitemap.xml'
-        with open(sitemap_filepath, 'w', encoding='utf-8') as f:
-            f.write(sitemap_xml)
+        self._write_output(sitemap_filepath, sitemap_xml.encode('utf-8'))
 
         self.logger.info(f"Sitemap generated: {sitemap_filepath}")
\ No newline at end of file
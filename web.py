@@ -5,11 +5,10 @@ AI早报前端项目启动脚本
 使用方法: python web.py
 """
 
+import importlib.util
 import os
 import sys
 import subprocess
-import threading
-import time
 from pathlib import Path
 
 # 添加frontend目录到Python路径
@@ -19,7 +18,6 @@ sys.path.insert(0, str(frontend_dir))
 def install_dependencies(packages):
     """安装依赖包"""
     try:
-        import subprocess
         subprocess.check_call([
             sys.executable, '-m', 'pip', 'install'
         ] + packages)
@@ -34,9 +32,8 @@ def check_dependencies():
     missing_packages = []
 
     for package in required_packages:
-        try:
-            __import__(package.replace('-', '_'))
-        except ImportError:
+        # 只查找模块是否存在，不执行模块的导入和初始化
+        if importlib.util.find_spec(package.replace('-', '_')) is None:
             missing_packages.append(package)
 
     if missing_packages:
@@ -47,15 +44,14 @@ def check_dependencies():
 def check_docs_directory():
     """检查docs目录是否存在"""
     docs_dir = Path(__file__).parent / "docs"
-    if not docs_dir.exists():
-        return False
-
-    # 检查是否有markdown文件
-    md_files = list(docs_dir.glob("*.md"))
-    if not md_files:
+    try:
+        entries = os.scandir(docs_dir)
+    except FileNotFoundError:
         return False
 
-    return True
+    # 检查是否有markdown文件，找到一个即可
+    with entries:
+        return any(entry.name.endswith('.md') and entry.is_file() for entry in entries)
 
 def main():
     """主函数"""
@@ -82,8 +78,14 @@ def main():
         # 导入app模块
         from app import app
 
-        # 直接运行Flask应用
-        app.run(debug=True, host='0.0.0.0', port=15000)
+        # 优先使用waitress作为WSGI服务器；未安装时使用Flask自带的多线程服务器，
+        # 关闭debug模式，避免重载器持续轮询文件变化
+        try:
+            from waitress import serve
+        except ImportError:  # waitress 为可选依赖
+            app.run(debug=False, host='0.0.0.0', port=15000, threaded=True)
+        else:
+            serve(app, host='0.0.0.0', port=15000, threads=8)
 
     except ImportError as e:
         print(f"✗ 无法导入应用模块: {e}")